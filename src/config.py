@@ -6,4 +6,5 @@ load_dotenv()
 # == Configuration Variables ==
 FILE_PATH = os.getenv("FILE_PATH", "/default/path/to/monitor")
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite+aiosqlite:///./test.db")
-OPEN_API_KEY = os.getenv("OPENAI_API_KEY", "your-default-api-key")
\ No newline at end of file
+OPEN_API_KEY = os.getenv("OPENAI_API_KEY", "your-default-api-key")
+TIKTOKEN_CACHE_DIR = os.getenv("TIKTOKEN_CACHE_DIR", "./data/tiktoken_cache")
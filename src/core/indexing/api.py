@@ -1,10 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException, Body
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Body
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 import logging
 
-from src.databases.database import get_db
-from src.databases.file.crud import get_file_status_by_path, update_file_status
+from src.databases.database import AsyncSessionLocal, get_db
+from src.databases.file.crud import list_file_statuses_by_paths, update_file_status, bulk_update_file_statuses
 from src.databases.file.models.file_status_enum import FileStatusEnum
 from src.core.indexing.index import index_files, search_similar, delete_file_from_index
 
@@ -13,27 +13,59 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/indexing", tags=["indexing"])
 
 
-@router.post("/run")
+async def _do_indexing(paths: List[str], file_ids: List[str]):
+    """
+    백그라운드에서 파일들을 인덱싱하고 결과에 따라 파일 상태를 업데이트합니다.
+    
+    요청 세션은 응답과 함께 닫히므로 별도의 세션을 사용합니다.
+    """
+    async with AsyncSessionLocal() as db:
+        try:
+            result = await index_files(paths, file_ids)
+            
+            # 성공한 파일은 SYNCED, 실패한 파일은 ERROR 상태로 한 번에 업데이트
+            failed_files = set(result.get("failed_files", []))
+            await bulk_update_file_statuses(db, {
+                file_id: FileStatusEnum.ERROR if path in failed_files else FileStatusEnum.SYNCED
+                for path, file_id in zip(paths, file_ids)
+            })
+            logger.info(f"Indexing completed: {result}")
+        except Exception as e:
+            logger.error(f"Error during indexing: {e}")
+            # 모든 파일을 ERROR 상태로 업데이트
+            try:
+                await db.rollback()
+                await bulk_update_file_statuses(db, {file_id: FileStatusEnum.ERROR for file_id in file_ids})
+            except Exception:
+                pass
+
+
+@router.post("/run", status_code=202)
 async def run_indexing(
-    paths: List[str] = Body(..., description="인덱싱할 파일 경로 리스트"),
+    background_tasks: BackgroundTasks,
+    paths: List[str] = Body(..., embed=True, description="인덱싱할 파일 경로 리스트"),
     db: AsyncSession = Depends(get_db),
 ):
     """
-    파일들을 인덱싱합니다.
+    파일들의 인덱싱을 백그라운드 작업으로 등록하고 바로 반환합니다.
+    
+    진행 상황은 /api/monitor 에서 파일 상태로 확인할 수 있습니다.
     
     - **paths**: 인덱싱할 파일 경로 리스트
     """
     if not paths:
         raise HTTPException(status_code=400, detail="No file paths provided")
     
-    # 파일 경로로부터 file_id 조회
+    # 파일 경로로부터 file_id 조회 (한 번의 쿼리로)
+    file_statuses = await list_file_statuses_by_paths(db, paths)
+    id_by_path = {f.path: f.id for f in file_statuses}
+    
     file_ids = []
     valid_paths = []
     
     for path in paths:
-        file_status = await get_file_status_by_path(db, path)
-        if file_status:
-            file_ids.append(file_status.id)
+        if path in id_by_path:
+            file_ids.append(id_by_path[path])
             valid_paths.append(path)
         else:
             logger.warning(f"File status not found for path: {path}")
@@ -41,33 +73,14 @@ async def run_indexing(
     if not valid_paths:
         raise HTTPException(status_code=404, detail="No valid files found for indexing")
     
-    # 인덱싱 실행
-    try:
-        result = index_files(valid_paths, file_ids)
-        
-        # 성공한 파일들의 상태를 SYNCED로 업데이트
-        for path, file_id in zip(valid_paths, file_ids):
-            if path in result.get("failed_files", []):
-                # 실패한 파일은 ERROR 상태로
-                await update_file_status(db, file_id, FileStatusEnum.ERROR)
-            else:
-                # 성공한 파일은 SYNCED 상태로
-                await update_file_status(db, file_id, FileStatusEnum.SYNCED)
-        
-        return {
-            "status": "completed",
-            "result": result,
-        }
-    except Exception as e:
-        logger.error(f"Error during indexing: {e}")
-        # 모든 파일을 ERROR 상태로 업데이트
-        for file_id in file_ids:
-            try:
-                await update_file_status(db, file_id, FileStatusEnum.ERROR)
-            except Exception:
-                pass
-        
-        raise HTTPException(status_code=500, detail=f"Indexing failed: {str(e)}")
+    # 인덱싱 대기 상태로 표시 후 백그라운드에서 실행
+    await bulk_update_file_statuses(db, {file_id: FileStatusEnum.PENDING for file_id in file_ids})
+    background_tasks.add_task(_do_indexing, valid_paths, file_ids)
+    
+    return {
+        "status": "queued",
+        "count": len(valid_paths),
+    }
 
 
 @router.post("/search")
@@ -85,7 +98,7 @@ async def search_index(
         raise HTTPException(status_code=400, detail="Query is required")
     
     try:
-        results = search_similar(query, limit=limit)
+        results = await search_similar(query, limit=limit)
         return {
             "query": query,
             "results": results,
@@ -0,0 +1,104 @@
+"""
+임베딩 벡터를 디스크에 캐시하는 모듈
+
+(모델, 청크 텍스트)의 SHA-256 해시를 키로 사용하여
+동일한 청크에 대해 임베딩 API를 다시 호출하지 않도록 합니다.
+"""
+
+import os
+import hashlib
+import logging
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# SQLite 바인딩 변수 개수 제한을 넘지 않도록 한 번에 조회할 키 수
+_LOOKUP_CHUNK_SIZE = 500
+
+
+def make_cache_key(model: str, text: str) -> str:
+    """
+    임베딩 캐시 키를 생성합니다.
+    
+    Args:
+        model: 임베딩 모델 이름
+        text: 임베딩할 텍스트
+        
+    Returns:
+        SHA-256 16진수 문자열
+    """
+    return hashlib.sha256((model + "\0" + text).encode("utf-8")).hexdigest()
+
+
+class CacheStrategy(ABC):
+    """임베딩 캐시 인터페이스"""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """키에 해당하는 벡터를 반환합니다. 없으면 None."""
+
+    @abstractmethod
+    def set(self, key: str, vector: List[float]) -> None:
+        """키에 벡터를 저장합니다."""
+
+    def get_many(self, keys: List[str]) -> Dict[str, np.ndarray]:
+        """캐시에 있는 키들의 벡터를 딕셔너리로 반환합니다."""
+        found = {}
+        for key in keys:
+            vector = self.get(key)
+            if vector is not None:
+                found[key] = vector
+        return found
+
+    def set_many(self, items: Dict[str, List[float]]) -> None:
+        """여러 벡터를 한 번에 저장합니다."""
+        for key, vector in items.items():
+            self.set(key, vector)
+
+
+class SQLiteEmbeddingCache(CacheStrategy):
+    """벡터를 float32 blob으로 SQLite에 저장하는 캐시"""
+
+    def __init__(self, db_path: str = "./data/embed_cache.db") -> None:
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+            )
+            self._conn.commit()
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        return self.get_many([key]).get(key)
+
+    def set(self, key: str, vector: List[float]) -> None:
+        self.set_many({key: vector})
+
+    def get_many(self, keys: List[str]) -> Dict[str, np.ndarray]:
+        found = {}
+        with self._lock:
+            for i in range(0, len(keys), _LOOKUP_CHUNK_SIZE):
+                chunk = keys[i:i + _LOOKUP_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})", chunk
+                ).fetchall()
+                for key, blob in rows:
+                    found[key] = np.frombuffer(blob, dtype=np.float32)
+        return found
+
+    def set_many(self, items: Dict[str, List[float]]) -> None:
+        rows = [
+            (key, np.asarray(vector, dtype=np.float32).tobytes())
+            for key, vector in items.items()
+        ]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)", rows
+            )
+            self._conn.commit()
@@ -3,18 +3,33 @@ OpenAI Embedding을 사용하여 LanceDB에 인덱싱하는 모듈
 """
 
 import os
+import asyncio
 import logging
+import random
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from collections import defaultdict
+from typing import List, Optional, Tuple
+import aiofiles
+import httpx
 import lancedb
+import numpy as np
 import pyarrow as pa
-from openai import OpenAI
-from src.config import OPEN_API_KEY
+from openai import AsyncOpenAI, BadRequestError
+from src.config import OPEN_API_KEY, TIKTOKEN_CACHE_DIR
+from src.core.indexing.cache import SQLiteEmbeddingCache, make_cache_key
+from src.core.indexing.ratelimit import AsyncTokenBucket
 
-logger = logging.getLogger(__name__)
+# BPE 테이블을 디스크에 캐시하여 재시작 시 다시 받지 않도록 함 (tiktoken import 전에 설정)
+os.environ.setdefault("TIKTOKEN_CACHE_DIR", TIKTOKEN_CACHE_DIR)
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
 
-# OpenAI 클라이언트 초기화
-client = OpenAI(api_key=OPEN_API_KEY)
+logger = logging.getLogger(__name__)
 
 # LanceDB 테이블 이름
 TABLE_NAME = "obsidirag_index"
@@ -23,14 +38,76 @@ TABLE_NAME = "obsidirag_index"
 EMBEDDING_MODEL = "text-embedding-3-small"  # 또는 "text-embedding-3-large"
 EMBEDDING_DIMENSION = 1536  # text-embedding-3-small의 차원
 
+# 인덱스 테이블 스키마 (벡터는 float16으로 저장하여 메모리/디스크 대역폭을 절반으로)
+INDEX_SCHEMA = pa.schema([
+    pa.field("vector", pa.list_(pa.float16(), EMBEDDING_DIMENSION)),
+    pa.field("text", pa.string()),
+    pa.field("file_id", pa.string()),
+    pa.field("file_path", pa.string()),
+    pa.field("chunk_index", pa.int32()),
+])
+
 # 청킹 설정
 CHUNK_SIZE = 1000  # 토큰 수
 CHUNK_OVERLAP = 200  # 오버랩 토큰 수
 
+# 임베딩 배치 설정 (API 한도: 요청당 2048개 입력, 300k 토큰)
+EMBEDDING_BATCH_MAX_INPUTS = 2048
+EMBEDDING_BATCH_MAX_TOKENS = 250_000
+EMBEDDING_MAX_CONCURRENCY = 5  # 동시에 처리할 최대 임베딩 요청 수
+EMBEDDING_REQUEST_JITTER = 0.05  # 429 방지를 위한 요청 전 지연 상한 (초)
+EMBEDDING_RPM_LIMIT = 3000  # 분당 최대 요청 수
+EMBEDDING_TPM_LIMIT = 1_000_000  # 분당 최대 토큰 수
+
+# 인덱싱 대상 파일 설정
+SUPPORTED_EXTS = frozenset({'.md', '.txt', '.py', '.js', '.ts', '.json', '.yaml', '.yml', '.csv'})
+MAX_FILE_BYTES = 2 * 1024 * 1024  # 이보다 큰 파일은 건너뜀
+
+# 파일 읽기/청킹과 임베딩 사이 큐 크기 (미리 읽어 둘 파일 수)
+FILE_QUEUE_SIZE = 8
+TOKENIZE_BATCH_SIZE = 32  # 한 번에 읽고 토큰화할 파일 수
+
+# LanceDB 쓰기 설정 (작은 fragment가 많이 생기지 않도록 모아서 추가)
+WRITE_FLUSH_MAX_ROWS = 10_000
+WRITE_FLUSH_MAX_BYTES = 64 * 1024 * 1024
+INDEX_MERGE_EVERY_N_RUNS = 10  # N번째 인덱싱마다 델타 인덱스 병합
+INDEX_MERGE_NUM_INDICES = 20
+
+# 벡터 인덱스 설정 (IVF_PQ)
+VECTOR_INDEX_MIN_ROWS = 10_000  # 이 행 수 이상일 때 인덱스 생성
+VECTOR_INDEX_METRIC = "cosine"
+VECTOR_INDEX_NUM_PARTITIONS = 256
+VECTOR_INDEX_NUM_SUB_VECTORS = 96
+SEARCH_NPROBES = 20
+SEARCH_REFINE_FACTOR = 10
 
+# OpenAI 클라이언트 초기화 (HTTP/2로 동시 요청을 하나의 연결에 다중화하고 연결을 재사용)
+client = AsyncOpenAI(
+    api_key=OPEN_API_KEY,
+    http_client=httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+        timeout=httpx.Timeout(60.0, connect=5.0),
+        http2=True,
+    ),
+)
+
+# 임베딩 API 속도 제한 (요청 수 / 토큰 수)
+request_bucket = AsyncTokenBucket(EMBEDDING_RPM_LIMIT, burst=EMBEDDING_MAX_CONCURRENCY)
+token_bucket = AsyncTokenBucket(EMBEDDING_TPM_LIMIT, burst=EMBEDDING_BATCH_MAX_TOKENS)
+
+
+# db_path별로 열어 둔 인덱스 테이블 핸들
+_TABLES: dict = {}
+_TABLES_LOCK = threading.Lock()
+
+# 인덱싱 실행 횟수 (주기적인 인덱스 병합에 사용)
+_index_run_count = 0
+
+
+@lru_cache(maxsize=4)
 def get_lancedb_connection(db_path: str = "./data/lancedb") -> lancedb.DBConnection:
     """
-    LanceDB 연결을 가져옵니다.
+    LanceDB 연결을 가져옵니다. db_path별로 연결을 재사용합니다.
     
     Args:
         db_path: LanceDB 데이터베이스 경로
@@ -42,42 +119,121 @@ def get_lancedb_connection(db_path: str = "./data/lancedb") -> lancedb.DBConnect
     return lancedb.connect(db_path)
 
 
-def chunk_text(text: str, chunk_size: int = CHUNK_SIZE, overlap: int = CHUNK_OVERLAP) -> List[str]:
+@lru_cache(maxsize=1)
+def get_embedding_cache() -> SQLiteEmbeddingCache:
     """
-    텍스트를 청크로 나눕니다.
+    임베딩 캐시 (모델 + 텍스트 해시 기준)를 가져옵니다.
+
+    임포트 시점에 캐시 DB 파일이 생기지 않도록 첫 사용 시 생성합니다.
+
+    Returns:
+        SQLiteEmbeddingCache 인스턴스
+    """
+    return SQLiteEmbeddingCache()
+
+
+@lru_cache(maxsize=None)
+def _get_encoding(name: str = "cl100k_base"):
+    """
+    tiktoken 인코딩을 한 번만 생성하여 재사용합니다.
     
     Args:
-        text: 청킹할 텍스트
+        name: 인코딩 이름
+        
+    Returns:
+        tiktoken 인코딩 객체, tiktoken이 없으면 None
+    """
+    if tiktoken is None:
+        return None
+    return tiktoken.get_encoding(name)
+
+
+def _chunk_texts_with_counts(texts: List[str], chunk_size: int = CHUNK_SIZE, overlap: int = CHUNK_OVERLAP) -> List[List[Tuple[str, int]]]:
+    """
+    여러 텍스트를 한 번에 토큰화하여 청크로 나누고 각 청크의 토큰 수를 함께 반환합니다.
+    
+    tiktoken의 배치 API(encode_ordinary_batch/decode_batch)를 사용하여
+    Rust 스레드 풀에서 병렬로 처리합니다.
+    
+    Args:
+        texts: 청킹할 텍스트 리스트
         chunk_size: 각 청크의 최대 토큰 수
         overlap: 청크 간 오버랩 토큰 수
         
     Returns:
-        텍스트 청크 리스트
+        텍스트별 (청크 텍스트, 토큰 수) 튜플 리스트
     """
-    try:
-        import tiktoken
-        encoding = tiktoken.get_encoding("cl100k_base")
-    except ImportError:
+    encoding = _get_encoding()
+    if encoding is None:
         logger.warning("tiktoken not available, using simple character-based chunking")
-        # tiktoken이 없으면 간단한 문자 기반 청킹
-        chunks = []
-        for i in range(0, len(text), chunk_size - overlap):
-            chunks.append(text[i:i + chunk_size])
-        return chunks
+        # tiktoken이 없으면 간단한 문자 기반 청킹 (문자 수를 토큰 수의 상한으로 사용)
+        results = []
+        for text in texts:
+            chunks = []
+            for i in range(0, len(text), chunk_size - overlap):
+                chunk = text[i:i + chunk_size]
+                chunks.append((chunk, len(chunk)))
+            results.append(chunks)
+        return results
     
     # tiktoken을 사용한 토큰 기반 청킹
-    tokens = encoding.encode(text)
-    chunks = []
+    num_threads = os.cpu_count() or 1
+    results = []
+    for tokens in encoding.encode_ordinary_batch(texts, num_threads=num_threads):
+        chunk_tokens = [tokens[i:i + chunk_size] for i in range(0, len(tokens), chunk_size - overlap)]
+        chunk_texts = encoding.decode_batch(chunk_tokens, num_threads=num_threads)
+        results.append([(text, len(toks)) for text, toks in zip(chunk_texts, chunk_tokens)])
     
-    for i in range(0, len(tokens), chunk_size - overlap):
-        chunk_tokens = tokens[i:i + chunk_size]
-        chunk_text = encoding.decode(chunk_tokens)
-        chunks.append(chunk_text)
+    return results
+
+
+def _chunk_text_with_counts(text: str, chunk_size: int = CHUNK_SIZE, overlap: int = CHUNK_OVERLAP) -> List[Tuple[str, int]]:
+    """
+    텍스트를 청크로 나누고 각 청크의 토큰 수를 함께 반환합니다.
+    
+    Args:
+        text: 청킹할 텍스트
+        chunk_size: 각 청크의 최대 토큰 수
+        overlap: 청크 간 오버랩 토큰 수
+        
+    Returns:
+        (청크 텍스트, 토큰 수) 튜플 리스트
+    """
+    return _chunk_texts_with_counts([text], chunk_size, overlap)[0]
+
+
+def _count_tokens(text: str) -> int:
+    """
+    텍스트의 토큰 수를 셉니다. tiktoken이 없으면 문자 수를 상한으로 사용합니다.
     
-    return chunks
+    Args:
+        text: 토큰 수를 셀 텍스트
+        
+    Returns:
+        토큰 수
+    """
+    encoding = _get_encoding()
+    if encoding is None:
+        return len(text)
+    return len(encoding.encode_ordinary(text))
 
 
-def read_file_content(file_path: str) -> Optional[str]:
+def chunk_text(text: str, chunk_size: int = CHUNK_SIZE, overlap: int = CHUNK_OVERLAP) -> List[str]:
+    """
+    텍스트를 청크로 나눕니다.
+    
+    Args:
+        text: 청킹할 텍스트
+        chunk_size: 각 청크의 최대 토큰 수
+        overlap: 청크 간 오버랩 토큰 수
+        
+    Returns:
+        텍스트 청크 리스트
+    """
+    return [chunk for chunk, _ in _chunk_text_with_counts(text, chunk_size, overlap)]
+
+
+async def read_file_content(file_path: str) -> Optional[str]:
     """
     파일 내용을 읽습니다.
     
@@ -89,112 +245,410 @@ def read_file_content(file_path: str) -> Optional[str]:
     """
     try:
         path = Path(file_path)
-        if not path.exists():
+        
+        # 텍스트 파일만 처리 (파일에 접근하기 전에 확장자로 먼저 거름)
+        if path.suffix.lower() not in SUPPORTED_EXTS:
+            logger.warning(f"Unsupported file type: {file_path}")
+            return None
+        
+        try:
+            size = path.stat().st_size
+        except FileNotFoundError:
             logger.error(f"File not found: {file_path}")
             return None
         
-        # 텍스트 파일만 처리
-        if path.suffix.lower() in ['.md', '.txt', '.py', '.js', '.ts', '.json', '.yaml', '.yml', '.csv']:
-            with open(path, 'r', encoding='utf-8', errors='ignore') as f:
-                return f.read()
-        else:
-            logger.warning(f"Unsupported file type: {file_path}")
+        if size > MAX_FILE_BYTES:
+            logger.warning(f"File too large to index ({size} bytes): {file_path}")
             return None
+        
+        async with aiofiles.open(path, 'r', encoding='utf-8', errors='ignore') as f:
+            return await f.read()
     except Exception as e:
         logger.error(f"Error reading file {file_path}: {e}")
         return None
 
 
-def create_embeddings(texts: List[str]) -> List[List[float]]:
+async def create_embeddings(texts: List[str], token_counts: Optional[List[int]] = None) -> List[List[float]]:
     """
     OpenAI Embedding API를 사용하여 텍스트 리스트의 임베딩을 생성합니다.
     
+    캐시에 있는 텍스트는 API를 호출하지 않고, 캐시에 없는 텍스트만
+    중복을 제거하여 요청한 뒤 결과를 캐시에 저장합니다.
+    요청 전에 분당 요청 수/토큰 수 한도만큼 대기합니다.
+    
     Args:
         texts: 임베딩을 생성할 텍스트 리스트
+        token_counts: 텍스트별 토큰 수 (없으면 직접 계산)
         
     Returns:
-        임베딩 벡터 리스트
+        임베딩 벡터 리스트 (texts와 같은 순서)
     """
+    keys = [make_cache_key(EMBEDDING_MODEL, text) for text in texts]
+    
     try:
-        response = client.embeddings.create(
-            model=EMBEDDING_MODEL,
-            input=texts
-        )
-        return [item.embedding for item in response.data]
+        vectors = await asyncio.to_thread(get_embedding_cache().get_many, keys)
     except Exception as e:
-        logger.error(f"Error creating embeddings: {e}")
-        raise
+        logger.warning(f"Error reading embedding cache: {e}")
+        vectors = {}
+    
+    # 캐시에 없는 텍스트만 (중복 제거하여) 요청
+    uncached = {}
+    uncached_tokens = 0
+    for i, (key, text) in enumerate(zip(keys, texts)):
+        if key not in vectors and key not in uncached:
+            uncached[key] = text
+            uncached_tokens += token_counts[i] if token_counts is not None else _count_tokens(text)
+    
+    if uncached:
+        await request_bucket.acquire()
+        await token_bucket.acquire(uncached_tokens)
+        try:
+            response = await client.embeddings.create(
+                model=EMBEDDING_MODEL,
+                input=list(uncached.values())
+            )
+        except Exception as e:
+            logger.error(f"Error creating embeddings: {e}")
+            raise
+        
+        new_vectors = {key: item.embedding for key, item in zip(uncached, response.data)}
+        vectors.update(new_vectors)
+        
+        try:
+            await asyncio.to_thread(get_embedding_cache().set_many, new_vectors)
+        except Exception as e:
+            logger.warning(f"Error writing embedding cache: {e}")
+    
+    return [vectors[key] for key in keys]
 
 
-def index_file(file_path: str, file_id: str, db_path: str = "./data/lancedb") -> bool:
+async def _create_embeddings_with_retry(texts: List[str], token_counts: List[int]) -> List[Optional[List[float]]]:
     """
-    단일 파일을 인덱싱합니다.
+    배치 단위로 임베딩을 생성하고, 입력 오류(400)로 실패한 경우에만 항목별로 재시도합니다.
+    그 외 오류(네트워크, 인증, 레이트 리밋 등)는 항목별로 재시도해도 실패하므로 배치 전체를 실패로 처리합니다.
     
     Args:
-        file_path: 인덱싱할 파일 경로
-        file_id: 파일 ID (FileStatus.id)
-        db_path: LanceDB 데이터베이스 경로
+        texts: 임베딩을 생성할 텍스트 리스트
+        token_counts: 텍스트별 토큰 수
         
     Returns:
-        성공 여부
+        임베딩 벡터 리스트 (실패한 항목은 None)
     """
     try:
-        # 파일 내용 읽기
-        content = read_file_content(file_path)
-        if not content:
-            return False
-        
-        # 텍스트 청킹
-        chunks = chunk_text(content)
-        if not chunks:
-            logger.warning(f"No chunks created for file: {file_path}")
-            return False
+        return await create_embeddings(texts, token_counts)
+    except BadRequestError as e:
+        logger.warning(f"Batch embedding rejected for {len(texts)} inputs, retrying per item: {e}")
+    except Exception as e:
+        logger.error(f"Batch embedding failed for {len(texts)} inputs: {e}")
+        return [None] * len(texts)
+    
+    embeddings = []
+    for text, n_tokens in zip(texts, token_counts):
+        try:
+            embeddings.append((await create_embeddings([text], [n_tokens]))[0])
+        except Exception:
+            embeddings.append(None)
+    return embeddings
+
+
+def _get_table(db_path: str = "./data/lancedb", create: bool = False):
+    """
+    인덱스 테이블 핸들을 가져옵니다. 한 번 연 핸들은 db_path별로 재사용합니다.
+    
+    Args:
+        db_path: LanceDB 데이터베이스 경로
+        create: 테이블이 없을 때 생성할지 여부
         
-        # 임베딩 생성
-        embeddings = create_embeddings(chunks)
+    Returns:
+        LanceDB 테이블 객체, 테이블이 없고 create=False이면 None
+    """
+    with _TABLES_LOCK:
+        table = _TABLES.get(db_path)
+        if table is not None:
+            return table
         
-        # LanceDB에 저장
         db = get_lancedb_connection(db_path)
-        
-        # 테이블이 없으면 생성
-        if TABLE_NAME not in db.table_names():
-            schema = pa.schema([
-                pa.field("vector", pa.list_(pa.float32(), EMBEDDING_DIMENSION)),
-                pa.field("text", pa.string()),
-                pa.field("file_id", pa.string()),
-                pa.field("file_path", pa.string()),
-                pa.field("chunk_index", pa.int32()),
-            ])
-            table = db.create_table(TABLE_NAME, schema=schema, mode="overwrite")
-        else:
+        if TABLE_NAME in db.table_names():
             table = db.open_table(TABLE_NAME)
+        elif create:
+            table = db.create_table(TABLE_NAME, schema=INDEX_SCHEMA, mode="overwrite")
+        else:
+            return None
         
-        # 데이터 준비
-        data = []
-        for i, (chunk, embedding) in enumerate(zip(chunks, embeddings)):
-            data.append({
-                "vector": embedding,
-                "text": chunk,
-                "file_id": file_id,
-                "file_path": file_path,
-                "chunk_index": i,
-            })
+        _TABLES[db_path] = table
+        return table
+
+
+def _reset_table(db_path: str = "./data/lancedb") -> None:
+    """
+    캐시된 테이블 핸들을 버려 다음 호출 시 다시 열도록 합니다.
+    
+    Args:
+        db_path: LanceDB 데이터베이스 경로
+    """
+    with _TABLES_LOCK:
+        _TABLES.pop(db_path, None)
+
+
+def _vector_dtype(schema: pa.Schema) -> np.dtype:
+    """
+    테이블 스키마의 벡터 원소 타입에 맞는 numpy dtype을 반환합니다.
+    
+    float32로 만들어진 기존 테이블도 그대로 사용할 수 있도록 테이블 스키마를 따릅니다.
+    
+    Args:
+        schema: 인덱스 테이블 스키마
         
-        # 테이블에 추가
-        table.add(data)
+    Returns:
+        벡터 원소의 numpy dtype
+    """
+    return np.dtype(schema.field("vector").type.value_type.to_pandas_dtype())
+
+
+def _build_record_batch(
+    vectors: list,
+    texts: List[str],
+    file_id: str,
+    file_path: str,
+    chunk_indices: List[int],
+    schema: pa.Schema = INDEX_SCHEMA,
+) -> pa.RecordBatch:
+    """
+    한 파일의 청크들로 인덱스 테이블용 Arrow RecordBatch를 만듭니다.
+    
+    벡터는 스키마의 원소 타입(float16/float32)으로 된 연속 배열 하나로 모아
+    FixedSizeList로 변환하므로 행마다 dict나 float 객체를 만들지 않습니다.
+    
+    Args:
+        vectors: 임베딩 벡터 리스트
+        texts: 청크 텍스트 리스트
+        file_id: 파일 ID
+        file_path: 파일 경로
+        chunk_indices: 청크 인덱스 리스트
+        schema: 대상 테이블 스키마
+        
+    Returns:
+        schema를 따르는 RecordBatch
+    """
+    n = len(texts)
+    matrix = np.asarray(vectors, dtype=_vector_dtype(schema)).reshape(n, EMBEDDING_DIMENSION)
+    vector_array = pa.FixedSizeListArray.from_arrays(pa.array(matrix.reshape(-1)), EMBEDDING_DIMENSION)
+    return pa.RecordBatch.from_arrays(
+        [
+            vector_array,
+            pa.array(texts, type=pa.string()),
+            pa.array([file_id] * n, type=pa.string()),
+            pa.array([file_path] * n, type=pa.string()),
+            pa.array(chunk_indices, type=pa.int32()),
+        ],
+        schema=schema,
+    )
+
+
+def _add_batches(table, batches: List[pa.RecordBatch]) -> bool:
+    """
+    여러 RecordBatch를 한 번의 table.add로 추가합니다.
+    
+    Args:
+        table: LanceDB 테이블 객체
+        batches: 추가할 RecordBatch 리스트
         
-        logger.info(f"Successfully indexed file: {file_path} ({len(chunks)} chunks)")
+    Returns:
+        성공 여부
+    """
+    try:
+        table.add(pa.Table.from_batches(batches))
         return True
+    except Exception as e:
+        logger.error(f"Error adding {len(batches)} batches to index: {e}")
+        return False
+
+
+def _optimize_indices(table, num_indices_to_merge: int = 0) -> None:
+    """
+    새로 추가된 행을 기존 인덱스에 반영합니다.
+    
+    Args:
+        table: LanceDB 테이블 객체
+        num_indices_to_merge: 병합할 델타 인덱스 수 (0이면 새 델타 인덱스만 생성)
+    """
+    try:
+        table.to_lance().optimize.optimize_indices(num_indices_to_merge=num_indices_to_merge)
+        # 별도 Lance 데이터셋으로 커밋했으므로 캐시된 테이블 핸들을 최신 버전으로 갱신
+        table.checkout_latest()
+    except Exception as e:
+        logger.warning(f"Error optimizing indices: {e}")
+
+
+def _ensure_scalar_index(table) -> None:
+    """
+    file_id 컬럼에 BTREE 스칼라 인덱스를 생성합니다. 이미 있으면 무시합니다.
+    
+    Args:
+        table: LanceDB 테이블 객체
+    """
+    try:
+        table.create_scalar_index("file_id", index_type="BTREE", replace=False)
+        logger.info("Created scalar index on file_id")
+    except Exception as e:
+        if "already exists" not in str(e).lower():
+            logger.warning(f"Error creating scalar index: {e}")
+
+
+def _sql_string_literal(value: str) -> str:
+    """
+    문자열을 SQL 문자열 리터럴로 변환합니다. (작은따옴표 이스케이프)
+    
+    Args:
+        value: 변환할 문자열
         
+    Returns:
+        작은따옴표로 감싼 SQL 리터럴
+    """
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _ensure_vector_index(table) -> bool:
+    """
+    행 수가 기준 이상이면 벡터 인덱스(IVF_PQ)를 생성합니다. 이미 있으면 무시합니다.
+    
+    Args:
+        table: LanceDB 테이블 객체
+        
+    Returns:
+        인덱스를 새로 생성했는지 여부
+    """
+    try:
+        if table.count_rows() < VECTOR_INDEX_MIN_ROWS:
+            return False
+        table.create_index(
+            metric=VECTOR_INDEX_METRIC,
+            vector_column_name="vector",
+            index_type="IVF_PQ",
+            num_partitions=VECTOR_INDEX_NUM_PARTITIONS,
+            num_sub_vectors=VECTOR_INDEX_NUM_SUB_VECTORS,
+            replace=False,
+        )
+        logger.info("Created vector index on index table")
+        return True
     except Exception as e:
-        logger.error(f"Error indexing file {file_path}: {e}")
+        if "already exists" not in str(e).lower():
+            logger.warning(f"Error creating vector index: {e}")
         return False
 
 
-def index_files(file_paths: List[str], file_ids: Optional[List[str]] = None, db_path: str = "./data/lancedb") -> dict:
+async def index_file(file_path: str, file_id: str, db_path: str = "./data/lancedb") -> bool:
+    """
+    단일 파일을 인덱싱합니다.
+    
+    Args:
+        file_path: 인덱싱할 파일 경로
+        file_id: 파일 ID (FileStatus.id)
+        db_path: LanceDB 데이터베이스 경로
+        
+    Returns:
+        성공 여부
+    """
+    result = await index_files([file_path], [file_id], db_path)
+    return result["failed"] == 0
+
+
+def _write_index(
+    items_by_file: dict,
+    items: list,
+    embeddings: list,
+    file_paths: List[str],
+    file_ids: List[str],
+    db_path: str,
+) -> set:
+    """
+    임베딩된 청크를 LanceDB에 저장하고 인덱스를 갱신합니다 (동기, 블로킹).
+    
+    행 수/크기 한도마다 한 번씩 table.add를 호출하고, 끝나면 스칼라/벡터 인덱스를
+    생성하거나 추가된 행을 기존 인덱스에 반영합니다.
+    
+    Args:
+        items_by_file: 파일 인덱스 -> 청크 항목 인덱스 리스트
+        items: (파일 인덱스, 청크 인덱스, 텍스트, 토큰 수) 리스트
+        embeddings: items와 같은 순서의 임베딩 리스트
+        file_paths: 파일 경로 리스트
+        file_ids: 파일 ID 리스트
+        db_path: LanceDB 데이터베이스 경로
+        
+    Returns:
+        저장에 실패한 파일 인덱스 집합
+    """
+    global _index_run_count
+    
+    try:
+        table = _get_table(db_path, create=True)
+        schema = table.schema
+    except Exception as e:
+        logger.error(f"Error opening index table: {e}")
+        _reset_table(db_path)
+        return set(items_by_file)
+    
+    failed = set()
+    pending = []  # (파일 인덱스, RecordBatch)
+    pending_rows = 0
+    pending_bytes = 0
+    
+    def flush() -> None:
+        if _add_batches(table, [batch for _, batch in pending]):
+            for file_idx, batch in pending:
+                logger.info(f"Successfully indexed file: {file_paths[file_idx]} ({batch.num_rows} chunks)")
+        else:
+            failed.update(file_idx for file_idx, _ in pending)
+        pending.clear()
+    
+    for file_idx, rows in items_by_file.items():
+        try:
+            batch = _build_record_batch(
+                [embeddings[i] for i in rows],
+                [items[i][2] for i in rows],
+                file_ids[file_idx],
+                file_paths[file_idx],
+                [items[i][1] for i in rows],
+                schema,
+            )
+        except Exception as e:
+            logger.error(f"Error indexing file {file_paths[file_idx]}: {e}")
+            failed.add(file_idx)
+            continue
+        
+        pending.append((file_idx, batch))
+        pending_rows += batch.num_rows
+        pending_bytes += batch.nbytes
+        if pending_rows >= WRITE_FLUSH_MAX_ROWS or pending_bytes >= WRITE_FLUSH_MAX_BYTES:
+            flush()
+            pending_rows = 0
+            pending_bytes = 0
+    
+    if pending:
+        flush()
+    
+    # 삭제 조회용 file_id 스칼라 인덱스 생성
+    _ensure_scalar_index(table)
+    
+    # 벡터 인덱스 생성, 이미 있으면 추가된 행을 인덱스에 반영 (주기적으로 델타 인덱스 병합)
+    if not _ensure_vector_index(table):
+        _index_run_count += 1
+        if _index_run_count % INDEX_MERGE_EVERY_N_RUNS == 0:
+            _optimize_indices(table, num_indices_to_merge=INDEX_MERGE_NUM_INDICES)
+        else:
+            _optimize_indices(table)
+    
+    return failed
+
+
+async def index_files(file_paths: List[str], file_ids: Optional[List[str]] = None, db_path: str = "./data/lancedb") -> dict:
     """
     여러 파일을 인덱싱합니다.
     
+    파일 읽기/청킹(producer)과 임베딩 요청(consumer)을 큐로 연결하여
+    디스크 I/O와 네트워크 I/O를 겹쳐 처리합니다. 청크는 입력 수/토큰 수 한도 내에서
+    배치로 묶여 동시에 임베딩되고, 여러 파일의 행을 모아 LanceDB에 저장합니다.
+    
     Args:
         file_paths: 인덱싱할 파일 경로 리스트
         file_ids: 파일 ID 리스트 (선택사항, file_paths와 같은 순서)
@@ -209,26 +663,107 @@ def index_files(file_paths: List[str], file_ids: Optional[List[str]] = None, db_
     if len(file_paths) != len(file_ids):
         raise ValueError("file_paths and file_ids must have the same length")
     
-    success_count = 0
-    fail_count = 0
-    failed_files = []
+    failed = set()
     
-    for file_path, file_id in zip(file_paths, file_ids):
-        if index_file(file_path, file_id, db_path):
-            success_count += 1
-        else:
-            fail_count += 1
-            failed_files.append(file_path)
+    # 청크 목록: (파일 인덱스, 청크 인덱스, 텍스트, 토큰 수)와 같은 위치의 임베딩
+    items = []
+    embeddings = []
+    semaphore = asyncio.Semaphore(EMBEDDING_MAX_CONCURRENCY)
+    queue = asyncio.Queue(maxsize=FILE_QUEUE_SIZE)
+    
+    async def embed_batch(batch: List[int]) -> None:
+        async with semaphore:
+            await asyncio.sleep(random.random() * EMBEDDING_REQUEST_JITTER)
+            vectors = await _create_embeddings_with_retry(
+                [items[i][2] for i in batch], [items[i][3] for i in batch]
+            )
+        for i, vector in zip(batch, vectors):
+            embeddings[i] = vector
+    
+    # 1. 파일을 묶음 단위로 읽고 한 번에 토큰화/청킹하여 큐에 넣음
+    async def produce() -> None:
+        try:
+            for start in range(0, len(file_paths), TOKENIZE_BATCH_SIZE):
+                group = range(start, min(start + TOKENIZE_BATCH_SIZE, len(file_paths)))
+                contents = await asyncio.gather(*(read_file_content(file_paths[i]) for i in group))
+                
+                readable = []
+                for file_idx, content in zip(group, contents):
+                    if content:
+                        readable.append((file_idx, content))
+                    else:
+                        failed.add(file_idx)
+                if not readable:
+                    continue
+                
+                try:
+                    chunk_lists = await asyncio.to_thread(
+                        _chunk_texts_with_counts, [content for _, content in readable]
+                    )
+                except Exception as e:
+                    logger.error(f"Error chunking {len(readable)} files: {e}")
+                    failed.update(file_idx for file_idx, _ in readable)
+                    continue
+                
+                for (file_idx, _), chunks in zip(readable, chunk_lists):
+                    if not chunks:
+                        logger.warning(f"No chunks created for file: {file_paths[file_idx]}")
+                        failed.add(file_idx)
+                        continue
+                    await queue.put((file_idx, chunks))
+        finally:
+            await queue.put(None)
+    
+    # 2. 청크를 배치로 묶어 임베딩 요청 (배치가 차는 대로 바로 요청)
+    async def consume() -> None:
+        tasks = []
+        batch = []
+        batch_tokens = 0
+        
+        while (entry := await queue.get()) is not None:
+            file_idx, chunks = entry
+            for chunk_index, (text, n_tokens) in enumerate(chunks):
+                if batch and (len(batch) >= EMBEDDING_BATCH_MAX_INPUTS or batch_tokens + n_tokens > EMBEDDING_BATCH_MAX_TOKENS):
+                    tasks.append(asyncio.create_task(embed_batch(batch)))
+                    batch = []
+                    batch_tokens = 0
+                items.append((file_idx, chunk_index, text, n_tokens))
+                embeddings.append(None)
+                batch.append(len(items) - 1)
+                batch_tokens += n_tokens
+        
+        if batch:
+            tasks.append(asyncio.create_task(embed_batch(batch)))
+        await asyncio.gather(*tasks)
+    
+    await asyncio.gather(produce(), consume())
+    
+    # 3. 파일별로 청크 인덱스 그룹화 (임베딩이 하나라도 실패한 파일은 제외)
+    items_by_file = defaultdict(list)
+    for i, (file_idx, _, _, _) in enumerate(items):
+        if embeddings[i] is None:
+            failed.add(file_idx)
+            continue
+        items_by_file[file_idx].append(i)
+    
+    # 4. LanceDB에 저장 및 인덱스 갱신 (블로킹 작업이므로 워커 스레드에서 실행)
+    items_by_file = {idx: rows for idx, rows in items_by_file.items() if idx not in failed}
+    if items_by_file:
+        failed.update(await asyncio.to_thread(
+            _write_index, items_by_file, items, embeddings, file_paths, file_ids, db_path
+        ))
+    
+    failed_files = [file_paths[i] for i in sorted(failed)]
     
     return {
         "total": len(file_paths),
-        "success": success_count,
-        "failed": fail_count,
+        "success": len(file_paths) - len(failed_files),
+        "failed": len(failed_files),
         "failed_files": failed_files,
     }
 
 
-def search_similar(query: str, limit: int = 10, db_path: str = "./data/lancedb") -> List[dict]:
+async def search_similar(query: str, limit: int = 10, db_path: str = "./data/lancedb") -> List[dict]:
     """
     유사한 텍스트를 검색합니다.
     
@@ -242,35 +777,49 @@ def search_similar(query: str, limit: int = 10, db_path: str = "./data/lancedb")
     """
     try:
         # 쿼리 임베딩 생성
-        query_embedding = create_embeddings([query])[0]
+        query_embedding = (await create_embeddings([query]))[0]
         
         # LanceDB에서 검색
-        db = get_lancedb_connection(db_path)
-        
-        if TABLE_NAME not in db.table_names():
+        table = _get_table(db_path)
+        if table is None:
             logger.warning("Index table does not exist")
             return []
         
-        table = db.open_table(TABLE_NAME)
-        
-        # 벡터 검색
-        results = table.search(query_embedding).limit(limit).to_pandas()
+        # 벡터 검색 (쿼리 벡터도 저장된 벡터와 같은 타입으로 변환)
+        query_embedding = np.asarray(query_embedding, dtype=_vector_dtype(table.schema))
+        results = (
+            table.search(query_embedding)
+            .metric(VECTOR_INDEX_METRIC)
+            .nprobes(SEARCH_NPROBES)
+            .refine_factor(SEARCH_REFINE_FACTOR)
+            .limit(limit)
+            .to_arrow()
+        )
         
-        # 결과 포맷팅
-        search_results = []
-        for _, row in results.iterrows():
-            search_results.append({
-                "text": row.get("text", ""),
-                "file_path": row.get("file_path", ""),
-                "file_id": row.get("file_id", ""),
-                "chunk_index": row.get("chunk_index", 0),
-                "score": row.get("_distance", 0.0) if "_distance" in row else 0.0,
-            })
+        # 결과 포맷팅 (Arrow 컬럼을 한 번에 변환)
+        texts = results.column("text").to_pylist()
+        file_paths = results.column("file_path").to_pylist()
+        file_ids = results.column("file_id").to_pylist()
+        chunk_indices = results.column("chunk_index").to_pylist()
+        if "_distance" in results.schema.names:
+            scores = results.column("_distance").to_pylist()
+        else:
+            scores = [0.0] * len(texts)
         
-        return search_results
+        return [
+            {
+                "text": text,
+                "file_path": file_path,
+                "file_id": file_id,
+                "chunk_index": chunk_index,
+                "score": score,
+            }
+            for text, file_path, file_id, chunk_index, score in zip(texts, file_paths, file_ids, chunk_indices, scores)
+        ]
         
     except Exception as e:
         logger.error(f"Error searching: {e}")
+        _reset_table(db_path)
         return []
 
 
@@ -286,25 +835,24 @@ def delete_file_from_index(file_id: str, db_path: str = "./data/lancedb") -> boo
         성공 여부
     """
     try:
-        db = get_lancedb_connection(db_path)
-        
-        if TABLE_NAME not in db.table_names():
+        table = _get_table(db_path)
+        if table is None:
             logger.warning("Index table does not exist")
             return False
         
-        table = db.open_table(TABLE_NAME)
-        
         # file_id로 필터링하여 삭제
         # LanceDB의 delete는 where 조건을 사용
+        where = f"file_id = {_sql_string_literal(file_id)}"
         try:
-            table.delete(where=f"file_id = '{file_id}'")
+            table.delete(where=where)
         except TypeError:
             # 구버전 호환성: where 파라미터 없이 직접 조건 전달
-            table.delete(f"file_id = '{file_id}'")
+            table.delete(where)
         
         logger.info(f"Successfully deleted file from index: {file_id}")
         return True
         
     except Exception as e:
         logger.error(f"Error deleting file from index {file_id}: {e}")
+        _reset_table(db_path)
         return False
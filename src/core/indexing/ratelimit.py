@@ -0,0 +1,40 @@
+"""
+OpenAI API 호출 속도를 제한하는 토큰 버킷 모듈
+
+요청 전에 미리 대기하여 429 응답과 Retry-After 백오프를 피합니다.
+"""
+
+import time
+import asyncio
+from typing import Optional
+
+
+class AsyncTokenBucket:
+    """분당 rate_per_min 만큼 채워지고 최대 burst 만큼 쌓이는 비동기 토큰 버킷"""
+
+    def __init__(self, rate_per_min: float, burst: Optional[float] = None) -> None:
+        self.rate = rate_per_min / 60.0  # 초당 충전량
+        self.capacity = burst if burst is not None else rate_per_min
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, tokens: float = 1) -> None:
+        """
+        토큰이 충분해질 때까지 기다린 뒤 차감합니다.
+        
+        Args:
+            tokens: 사용할 토큰 수 (버킷 용량보다 크면 용량만큼만 기다림)
+        """
+        tokens = min(tokens, self.capacity)
+        async with self._lock:
+            self._refill()
+            while self._tokens < tokens:
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= tokens
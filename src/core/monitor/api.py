@@ -1,17 +1,18 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
 
 from src.databases.database import get_db
 from src.databases.file.models.file_status import FileStatus
 from src.databases.file.models.file_status_enum import FileStatusEnum
-from src.databases.file.crud import get_file_status
+from src.databases.file.crud import get_file_status, list_all_file_status_rows
 from src.databases.schemas.file_status import (
     FileStatusResponse,
     FileStatusStats,
     FileStatusSummary,
 )
 import logging
+import orjson
 
 logger = logging.getLogger(__name__)
 
@@ -63,6 +64,20 @@ async def get_files_by_status(
     return [FileStatusResponse.model_validate(f) for f in files]
 
 
+@router.get("/files/statuses", response_model=list[FileStatusResponse])
+async def get_all_file_statuses(
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    추적 중인 모든 파일의 상태를 페이지네이션 없이 조회합니다.
+
+    Streamlit UI가 전체 목록을 한 번에 가져갈 때 사용합니다.
+    """
+    rows = await list_all_file_status_rows(db)
+    # 컬럼 매핑을 orjson으로 바로 직렬화 (모델 검증/jsonable_encoder 생략)
+    return Response(orjson.dumps([dict(r) for r in rows]), media_type="application/json")
+
+
 @router.get("/files/{file_id}", response_model=FileStatusResponse)
 async def get_file_by_id(
     file_id: str,
@@ -1,98 +1,188 @@
 import time
 import os
 import asyncio
+import logging
+import threading
 from watchdog.events import FileSystemEventHandler, PatternMatchingEventHandler
 from watchdog.observers import Observer
 from uuid import uuid4
 
 from src.databases.file.crud import (
     create_file_status,
-    update_file_status,
     delete_file_status,
     get_file_status_by_path,
     rename_file_status,
+    list_file_statuses_by_paths,
+    bulk_update_file_statuses,
 )
 from src.databases.file.models.file_status import FileStatus
 from src.databases.file.models.file_status_enum import FileStatusEnum
 from src.databases.database import AsyncSessionLocal
 
+logger = logging.getLogger(__name__)
+
+# 이벤트를 모아서 한 번에 처리하기 위해 첫 이벤트 이후 기다리는 시간 (초)
+DEBOUNCE_INTERVAL = 0.2
+
+# worker에게 남은 이벤트를 반영하고 종료하라고 알리는 큐 표식
+_STOP = object()
+
 class WatchdogHandler(PatternMatchingEventHandler):
     """
     handles events for a specific event target file system path
     """
 
-    def __init__(self, Callback=None):
+    def __init__(self, Callback=None, loop=None):
         super().__init__(
             patterns=["*"], ignore_patterns=["*/.obsidian/workspace.json", "*/env/*"], 
             ignore_directories=True, case_sensitive=True
         )
         self.callback = Callback
+        self._loop = loop
+        if self._loop is None:
+            try:
+                # capture the running loop if available so we can schedule coroutines
+                self._loop = asyncio.get_running_loop()
+            except RuntimeError:
+                # 실행 중인 루프가 없으면 전용 루프를 백그라운드 스레드에서 한 번만 띄움
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(target=self._loop.run_forever, name="watchdog-db-loop", daemon=True).start()
+        # 이벤트는 큐에 넣고, 하나의 worker가 세션 하나로 모아서 처리
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._worker_future = asyncio.run_coroutine_threadsafe(self._worker(), self._loop)
+        self._worker_future.add_done_callback(self._on_worker_done)
+
+    @staticmethod
+    def _on_worker_done(future):
+        """worker가 예외로 종료되면 이후 이벤트가 반영되지 않으므로 로그로 남깁니다."""
+        if future.cancelled():
+            return
+        exc = future.exception()
+        if exc is not None:
+            logger.error("Watchdog DB worker stopped; file events will no longer be recorded", exc_info=exc)
+
+    def close(self, timeout: float = 5.0) -> None:
+        """큐에 남은 이벤트를 한 번 반영한 뒤 worker를 종료합니다."""
+        if self._worker_future.done():
+            return
+        self._loop.call_soon_threadsafe(self._queue.put_nowait, _STOP)
         try:
-            # capture the running loop if available so we can schedule coroutines
-            self._loop = asyncio.get_running_loop()
+            if asyncio.get_running_loop() is self._loop:
+                # 같은 루프에서 기다리면 교착되므로 표식만 넣고 worker가 스스로 종료하도록 둠
+                return
         except RuntimeError:
-            self._loop = None
+            pass
+        try:
+            self._worker_future.result(timeout)
+        except TimeoutError:
+            logger.warning("Watchdog DB worker did not finish within %.1fs; cancelling", timeout)
+        except Exception:
+            # worker 예외는 _on_worker_done에서 이미 기록됨
+            pass
+        finally:
+            self._worker_future.cancel()
 
-    async def _create_file_status_async(self, file_status: FileStatus):
-        async with AsyncSessionLocal() as session:
-            await create_file_status(db=session, file_status=file_status)
-    
-    async def _update_file_status_async(self, file_path: str, new_status: FileStatusEnum = FileStatusEnum.MODIFIED):
-        async with AsyncSessionLocal() as session:
-            existing = await get_file_status_by_path(db=session, file_path=file_path)
-            if existing:
-                await update_file_status(db=session, file_id=existing.id, new_status=new_status)
+    def _enqueue(self, *event):
+        """watchdog 스레드에서 이벤트 루프의 큐로 이벤트를 넘깁니다."""
+        self._loop.call_soon_threadsafe(self._queue.put_nowait, event)
 
-    async def _delete_file_status_async(self, file_path: str):
+    async def _worker(self):
+        """큐의 이벤트를 DEBOUNCE_INTERVAL 동안 모아 한 번의 commit으로 반영합니다."""
         async with AsyncSessionLocal() as session:
-            existing = await get_file_status_by_path(db=session, file_path=file_path)
-            if existing:
-                await delete_file_status(db=session, file_id=existing.id)
+            stopping = False
+            while not stopping:
+                event = await self._queue.get()
+                if event is _STOP:
+                    return
+                events = [event]
+                await asyncio.sleep(DEBOUNCE_INTERVAL)
+                try:
+                    while True:
+                        event = self._queue.get_nowait()
+                        if event is _STOP:
+                            stopping = True
+                            break
+                        events.append(event)
+                except asyncio.QueueEmpty:
+                    pass
 
-    async def _rename_file_status_async(self, old_path: str, new_path: str):
-        async with AsyncSessionLocal() as session:
-            await rename_file_status(db=session, old_path=old_path, new_path=new_path)
+                try:
+                    await self._apply_events(session, events)
+                    await session.commit()
+                except Exception:
+                    # 한 이벤트의 실패로 나머지 이벤트까지 버려지지 않도록 하나씩 다시 적용
+                    logger.warning("Failed to apply %d file events as a batch; retrying one by one", len(events), exc_info=True)
+                    await session.rollback()
+                    await self._apply_each(session, events)
+                finally:
+                    session.expunge_all()
+
+    async def _apply_each(self, session, events):
+        """이벤트마다 별도 트랜잭션으로 적용합니다. 실패한 이벤트만 롤백됩니다."""
+        for event in events:
+            try:
+                await self._apply_events(session, [event])
+                await session.commit()
+            except Exception:
+                logger.exception("Failed to apply file event: %s", event)
+                await session.rollback()
+
+    async def _apply_events(self, session, events):
+        """이벤트를 순서대로 적용합니다. 연속된 수정 이벤트는 경로별로 합쳐 한 번에 업데이트합니다."""
+        modified = set()
+        for kind, *args in events:
+            if kind == "modified":
+                modified.add(args[0])
+                continue
+            if modified:
+                await self._mark_modified(session, modified)
+                modified = set()
+            if kind == "created":
+                await create_file_status(db=session, file_status=args[0], commit=False)
+            elif kind == "deleted":
+                existing = await get_file_status_by_path(db=session, file_path=args[0])
+                if existing:
+                    await delete_file_status(db=session, file_id=existing.id, commit=False)
+            elif kind == "moved":
+                await rename_file_status(db=session, old_path=args[0], new_path=args[1], commit=False)
+        if modified:
+            await self._mark_modified(session, modified)
+
+    async def _mark_modified(self, session, file_paths):
+        existing = await list_file_statuses_by_paths(db=session, file_paths=list(file_paths))
+        if existing:
+            await bulk_update_file_statuses(
+                db=session,
+                status_updates={f.id: FileStatusEnum.MODIFIED for f in existing},
+                commit=False,
+            )
 
     def on_created(self, event):
         if not event.is_directory:
-            print(f"[생성] 파일이 생성되었습니다: {event.src_path}")
+            logger.debug("[생성] 파일이 생성되었습니다: %s", event.src_path)
             file_status = FileStatus(
                 id=uuid4().hex,
                 name=os.path.basename(event.src_path),
                 path=event.src_path,
                 status=FileStatusEnum.PENDING
             )
-            # Schedule DB write on the main asyncio loop if available
-            if self._loop:
-                asyncio.run_coroutine_threadsafe(self._create_file_status_async(file_status), self._loop)
-            else:
-                # fallback: run in a new event loop (blocking this thread)
-                asyncio.run(self._create_file_status_async(file_status))
+            self._enqueue("created", file_status)
 
 
     def on_modified(self, event):
         if not event.is_directory:
-            print(f"[수정] 파일이 수정되었습니다: {event.src_path}")
-            if self._loop:
-                asyncio.run_coroutine_threadsafe(self._update_file_status_async(event.src_path, FileStatusEnum.MODIFIED), self._loop)
-            else:
-                asyncio.run(self._update_file_status_async(event.src_path, FileStatusEnum.MODIFIED))
+            logger.debug("[수정] 파일이 수정되었습니다: %s", event.src_path)
+            self._enqueue("modified", event.src_path)
 
     def on_deleted(self, event):
         if not event.is_directory:
-            print(f"[삭제] 파일이 삭제되었습니다: {event.src_path}")
-            if self._loop:
-                asyncio.run_coroutine_threadsafe(self._delete_file_status_async(event.src_path), self._loop)
-            else:
-                asyncio.run(self._delete_file_status_async(event.src_path))
+            logger.debug("[삭제] 파일이 삭제되었습니다: %s", event.src_path)
+            self._enqueue("deleted", event.src_path)
 
     def on_moved(self, event):
         if not event.is_directory:
-            print(f"[이동] 파일이 이동/이름변경 되었습니다: {event.src_path} -> {event.dest_path}")
-            if self._loop:
-                asyncio.run_coroutine_threadsafe(self._rename_file_status_async(event.src_path, event.dest_path), self._loop)
-            else:
-                asyncio.run(self._rename_file_status_async(event.src_path, event.dest_path))
+            logger.debug("[이동] 파일이 이동/이름변경 되었습니다: %s -> %s", event.src_path, event.dest_path)
+            self._enqueue("moved", event.src_path, event.dest_path)
 
 
 # 2. Set up the observer
@@ -3,6 +3,7 @@ watchdog 실행 및 관리
 """
 
 from typing import Callable, Optional
+import asyncio
 import logging
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler, FileSystemEvent, PatternMatchingEventHandler
@@ -24,18 +25,22 @@ class WatchdogManager:
 		callback: Optional[Callable[[FileSystemEvent], None]] = None,
 		recursive: bool = True,
 		logger: Optional[logging.Logger] = None,
+		loop: Optional[asyncio.AbstractEventLoop] = None,
 	) -> None:
 		self.path = path
 		self.recursive = recursive
+		# DB 작업을 예약할 이벤트 루프 (다른 스레드에서 start()를 호출할 때 필요)
+		self.loop = loop
 		self.logger = logger or logging.getLogger(__name__)
 		self._observer: Optional[Observer] = None
-		self._handler: Optional[FileSystemEventHandler, PatternMatchingEventHandler] = None
+		self._callback: Optional[Callable[[FileSystemEvent], None]] = None
+		self._handler: Optional[WatchdogHandler] = None
 		if callback is not None:
 			self.set_callback(callback)
 
 	def set_callback(self, callback: Callable[[FileSystemEvent], None]) -> None:
-		"""파일 이벤트가 발생했을 때 호출할 콜백을 등록합니다."""
-		self._handler = WatchdogHandler(callback)
+		"""파일 이벤트가 발생했을 때 호출할 콜백을 등록합니다. 다음 start()부터 적용됩니다."""
+		self._callback = callback
 
 	def start(self) -> None:
 		"""Observer를 시작합니다. 이미 시작된 경우는 무시합니다."""
@@ -44,17 +49,21 @@ class WatchdogManager:
 			return
 
 		self._observer = Observer()
-		handler = self._handler or WatchdogHandler(lambda e: self.logger.debug(f"event: {e}"))
-		self._observer.schedule(handler, self.path, recursive=self.recursive)
+		# handler마다 DB worker가 붙으므로 start마다 새로 만들고 stop에서 닫음
+		callback = self._callback or (lambda e: self.logger.debug(f"event: {e}"))
+		self._handler = WatchdogHandler(callback, loop=self.loop)
+		self._observer.schedule(self._handler, self.path, recursive=self.recursive)
 		try:
 			self._observer.start()
 			self.logger.info(f"Started watchdog on: {self.path} (recursive={self.recursive})")
 		except Exception as exc:  # pragma: no cover - runtime safety
 			self.logger.exception("Failed to start watchdog observer: %s", exc)
 			self._observer = None
+			self._handler.close()
+			self._handler = None
 
 	def stop(self, timeout: float = 5.0) -> None:
-		"""Observer를 중지하고 join 합니다."""
+		"""Observer를 중지하고 join 한 뒤, 남은 이벤트를 반영하고 handler의 worker를 종료합니다."""
 		if not self._observer:
 			self.logger.debug("Observer not running")
 			return
@@ -66,6 +75,9 @@ class WatchdogManager:
 			self.logger.exception("Error stopping observer: %s", exc)
 		finally:
 			self._observer = None
+			if self._handler is not None:
+				self._handler.close(timeout)
+				self._handler = None
 
 	def restart(self) -> None:
 		"""Observer를 재시작합니다."""
@@ -1,5 +1,6 @@
 # engine & db session setup
 
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from src.config import DATABASE_URL
 from src.databases.base import Base
@@ -16,6 +17,8 @@ async def init_db() -> None:
     """
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        # create_all은 이미 존재하는 테이블에 인덱스를 추가하지 않으므로 기존 DB에도 생성
+        await conn.execute(text("CREATE INDEX IF NOT EXISTS ix_file_status_path ON file_status (path)"))
 
 
 AsyncSessionLocal = async_sessionmaker(bind=engine, expire_on_commit=False)
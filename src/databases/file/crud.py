@@ -2,8 +2,9 @@ from src.databases.file.models.file_status import FileStatus
 from src.databases.file.models.file_status_enum import FileStatusEnum
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update, delete, insert, func
+from collections import defaultdict
 
-async def create_file_status(db: AsyncSession, file_status: FileStatus):
+async def create_file_status(db: AsyncSession, file_status: FileStatus, commit: bool = True):
     stmt = insert(FileStatus).values(
         id=file_status.id,
         name=file_status.name,
@@ -11,7 +12,8 @@ async def create_file_status(db: AsyncSession, file_status: FileStatus):
         status=file_status.status
     )
     await db.execute(stmt)
-    await db.commit()
+    if commit:
+        await db.commit()
     return file_status
 
 
@@ -30,16 +32,27 @@ async def update_file_status(db: AsyncSession, file_id: str, new_status: FileSta
     await db.execute(stmt)
     await db.commit()
 
-async def delete_file_status(db: AsyncSession, file_id: str):
+async def delete_file_status(db: AsyncSession, file_id: str, commit: bool = True):
     stmt = delete(FileStatus).where(FileStatus.id == file_id)
     await db.execute(stmt)
-    await db.commit()
+    if commit:
+        await db.commit()
 
 async def list_all_file_statuses(db: AsyncSession):
     stmt = select(FileStatus)
     result = await db.execute(stmt)
     return result.scalars().all()
 
+async def list_all_file_status_rows(db: AsyncSession):
+    # ORM 객체 대신 필요한 컬럼만 조회해 dict로 반환 (identity map 생략)
+    # 경로 순으로 정렬해 조회마다 행 순서가 같도록 함 (UI 선택 상태가 행 번호 기준)
+    stmt = (
+        select(FileStatus.id, FileStatus.name, FileStatus.path, FileStatus.status)
+        .order_by(FileStatus.path)
+    )
+    result = await db.execute(stmt)
+    return result.mappings().all()
+
 async def list_file_statuses_by_status(db: AsyncSession, status: FileStatusEnum | str):
     stmt = select(FileStatus).where(FileStatus.status == status)
     result = await db.execute(stmt)
@@ -50,16 +63,21 @@ async def count_file_statuses_by_status(db: AsyncSession, status: FileStatusEnum
     result = await db.execute(stmt)
     return result.scalar() or 0
 
-async def bulk_update_file_statuses(db: AsyncSession, status_updates: dict):
+async def bulk_update_file_statuses(db: AsyncSession, status_updates: dict, commit: bool = True):
+    # 같은 상태로 바뀌는 파일들을 묶어 상태별로 한 번만 UPDATE
+    ids_by_status = defaultdict(list)
     for file_id, new_status in status_updates.items():
+        ids_by_status[new_status].append(file_id)
+    for new_status, file_ids in ids_by_status.items():
         stmt = (
             update(FileStatus).
-            where(FileStatus.id == file_id).
+            where(FileStatus.id.in_(file_ids)).
             values(status=new_status).
             execution_options(synchronize_session="fetch")
         )
         await db.execute(stmt)
-    await db.commit()    
+    if commit:
+        await db.commit()
 
 async def bulk_delete_file_statuses(db: AsyncSession, file_ids: list):
     stmt = delete(FileStatus).where(FileStatus.id.in_(file_ids))
@@ -71,7 +89,12 @@ async def get_file_status_by_path(db: AsyncSession, file_path: str):
     result = await db.execute(stmt)
     return result.scalar_one_or_none()
 
-async def rename_file_status(db: AsyncSession, old_path: str, new_path: str):
+async def list_file_statuses_by_paths(db: AsyncSession, file_paths: list[str]):
+    stmt = select(FileStatus).where(FileStatus.path.in_(file_paths))
+    result = await db.execute(stmt)
+    return result.scalars().all()
+
+async def rename_file_status(db: AsyncSession, old_path: str, new_path: str, commit: bool = True):
     stmt = (
         update(FileStatus).
         where(FileStatus.path == old_path).
@@ -79,7 +102,8 @@ async def rename_file_status(db: AsyncSession, old_path: str, new_path: str):
         execution_options(synchronize_session="fetch")
     )
     await db.execute(stmt)
-    await db.commit()   
+    if commit:
+        await db.commit()
 
 
 async def list_file_statuses_by_name_pattern(db: AsyncSession, name_pattern: str):
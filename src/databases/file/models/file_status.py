@@ -9,7 +9,7 @@ class FileStatus(Base):
 
     id: Mapped[str] = mapped_column(String, primary_key=True)
     name: Mapped[str] = mapped_column(String, nullable=False)
-    path: Mapped[str] = mapped_column(String, nullable=False)
+    path: Mapped[str] = mapped_column(String, nullable=False, index=True)
     status: Mapped[FileStatusEnum] = mapped_column(
         SQLEnum(FileStatusEnum),
         default=FileStatusEnum.PENDING,
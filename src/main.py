@@ -3,12 +3,12 @@ from src.core.monitor.manager import WatchdogManager
 
 from fastapi import FastAPI
 from contextlib import asynccontextmanager
+import asyncio
+import socket
 import subprocess
 import sys
 import os
 from pathlib import Path
-import socket
-import time
 
 from src.config import FILE_PATH
 from src.databases.database import get_db, init_db
@@ -16,64 +16,111 @@ from src.databases.database import get_db, init_db
 from src.core.indexing.api import router as indexing_router
 from src.core.monitor.api import router as monitor_router
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    # initialize database (async)
-    await init_db()
-    print("Database initialized.")
-    # Start Streamlit as a background subprocess
+# Streamlit 서브프로세스 실행 설정 (임포트 시 한 번만 계산)
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+_STREAMLIT_SCRIPT = _PROJECT_ROOT / "src" / "ui" / "streamlit_app.py"
+_STREAMLIT_LOG = _PROJECT_ROOT / "streamlit.log"
+_STREAMLIT_PORT = int(os.getenv("STREAMLIT_PORT", "8501"))
+_STREAMLIT_CMD = (
+    sys.executable, "-m", "streamlit", "run", str(_STREAMLIT_SCRIPT),
+    "--server.port", str(_STREAMLIT_PORT), "--server.headless", "true",
+)
+
+
+async def _spawn_streamlit():
+    """Start Streamlit as a background subprocess and wait until it is reachable."""
     streamlit_proc = None
     try:
-        project_root = Path(__file__).resolve().parent.parent
-        streamlit_script = project_root / "src" / "ui" / "streamlit_app.py"
-        streamlit_port = int(os.getenv("STREAMLIT_PORT", "8501"))
-        cmd = [sys.executable, "-m", "streamlit", "run", str(streamlit_script), "--server.port", str(streamlit_port), "--server.headless", "true"]
-        log_file = project_root / "streamlit.log"
-        lf = open(log_file, "a")
-        streamlit_proc = subprocess.Popen(cmd, cwd=str(project_root), stdout=lf, stderr=subprocess.STDOUT)
+        streamlit_port = _STREAMLIT_PORT
+        log_file = _STREAMLIT_LOG
+        # 자식 프로세스는 fd를 상속받아 직접 쓰므로 부모 쪽 핸들은 Popen 직후 닫음
+        with open(log_file, "a") as lf:
+            streamlit_proc = subprocess.Popen(_STREAMLIT_CMD, cwd=_PROJECT_ROOT, stdout=lf, stderr=subprocess.STDOUT)
         print(f"Started Streamlit (pid={streamlit_proc.pid}) on port {streamlit_port}, logging to {log_file}")
 
-        # wait for port to become available
-        def _port_open(host: str, port: int) -> bool:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.settimeout(0.5)
-                return s.connect_ex((host, port)) == 0
+        # wait for port to become available (without blocking the event loop)
+        async def _port_open(host: str, port: int) -> bool:
+            try:
+                # IPv4 전용 조회로 AAAA 조회/IPv6 시도 생략
+                _, writer = await asyncio.wait_for(
+                    asyncio.open_connection(host, port, family=socket.AF_INET), timeout=0.1
+                )
+                writer.close()
+                await writer.wait_closed()
+                return True
+            except (OSError, asyncio.TimeoutError):
+                return False
 
         host = "127.0.0.1"
         timeout = 10
-        start = time.time()
-        while time.time() - start < timeout:
-            if _port_open(host, streamlit_port):
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while loop.time() < deadline:
+            if await _port_open(host, streamlit_port):
                 print(f"Streamlit reachable at http://{host}:{streamlit_port}")
                 break
             if streamlit_proc.poll() is not None:
                 # process exited
                 print("Streamlit process exited early; check streamlit.log for details")
                 break
-            time.sleep(0.5)
+            await asyncio.sleep(0.1)
         else:
             print(f"Streamlit did not become reachable on port {streamlit_port} within {timeout}s; see {log_file}")
     except Exception as exc:
         print("Failed to start Streamlit:", exc)
+    return streamlit_proc
 
-    manager = WatchdogManager(FILE_PATH)
-    try:
-        manager.start()
-        print("Watchdog observer started.")
-        yield
-    finally:
-        manager.stop()
+
+async def _init_db_and_start_watchdog(manager: WatchdogManager):
+    # initialize database (async) before watchdog events can write to it
+    await init_db()
+    print("Database initialized.")
+    await asyncio.to_thread(manager.start)
+    print("Watchdog observer started.")
+
+
+async def _shutdown(manager: WatchdogManager, streamlit_proc):
+    # observer join과 Streamlit 종료 대기를 워커 스레드에서 동시에 진행 (루프는 블로킹하지 않음)
+    shutdown = [asyncio.to_thread(manager.stop)]
+    if streamlit_proc:
+        try:
+            streamlit_proc.terminate()
+        except Exception:
+            pass
+        shutdown.append(asyncio.to_thread(streamlit_proc.wait, 5))
+    results = await asyncio.gather(*shutdown, return_exceptions=True)
+    if isinstance(results[0], BaseException):
+        print("Failed to stop watchdog observer:", results[0])
+    else:
         print("Watchdog observer stopped.")
-        if streamlit_proc:
+    if streamlit_proc:
+        if isinstance(results[1], BaseException):
             try:
-                streamlit_proc.terminate()
-                streamlit_proc.wait(timeout=5)
-                print("Streamlit subprocess terminated.")
+                streamlit_proc.kill()
             except Exception:
-                try:
-                    streamlit_proc.kill()
-                except Exception:
-                    pass
+                pass
+        else:
+            print("Streamlit subprocess terminated.")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # DB init + watchdog start overlap with Streamlit startup/readiness wait
+    manager = WatchdogManager(FILE_PATH, loop=asyncio.get_running_loop())
+    streamlit_proc, init_result = await asyncio.gather(
+        _spawn_streamlit(), _init_db_and_start_watchdog(manager), return_exceptions=True
+    )
+    if isinstance(streamlit_proc, BaseException):
+        print("Failed to start Streamlit:", streamlit_proc)
+        streamlit_proc = None
+    if isinstance(init_result, BaseException):
+        # DB 초기화 실패 시 이미 띄운 Streamlit/observer를 정리한 뒤 시작을 중단
+        await _shutdown(manager, streamlit_proc)
+        raise init_result
+    try:
+        yield
+    finally:
+        await _shutdown(manager, streamlit_proc)
 
 app = FastAPI(lifespan=lifespan)
 app.include_router(indexing_router)
@@ -1,71 +1,129 @@
 """
-Simple Streamlit app to list file statuses from the async database.
+Simple Streamlit app to list file statuses served by the FastAPI backend.
 
 Run:
     pip install streamlit
     streamlit run ui/streamlit_app.py
 
 Notes:
-- This app runs the project's async DB calls in a separate thread event loop when needed.
-- Ensure `DATABASE_URL` is configured and the app has been initialized (or `uvicorn` started with `init_db()` ran).
+- This app does not touch the database; it reads file statuses from the API server.
+- Ensure the API server is running and reachable at `API_URL` (default `http://127.0.0.1:8000`).
 """
 
 import streamlit as st
 import asyncio
+import concurrent.futures
+import logging
 import threading
-from typing import Any, List, Dict
 
-from src.databases.file.crud import list_all_file_statuses
 from src.databases.file.models.file_status_enum import FileStatusEnum
-from src.databases.database import AsyncSessionLocal
 import os
+import httpx
+import orjson
+import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
 
 
-def _run_coro_in_thread(coro):
-    """Run coroutine in a dedicated thread/event-loop and return result."""
+logger = logging.getLogger(__name__)
+
+API_URL = os.getenv("API_URL", "http://127.0.0.1:8000")
+# 인덱싱 요청 응답을 기다리는 최대 시간 (초), 초과 시 UI는 바로 반환
+INDEXING_ACK_TIMEOUT = 0.5
+
+
+@st.cache_resource
+def _http() -> requests.Session:
+    """Keep-alive HTTP session reused for calls to the API server."""
+    session = requests.Session()
+    session.headers.update({"Content-Type": "application/json"})
+    session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+    return session
+
+
+@st.cache_resource
+def _async_http() -> tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]:
+    """Background event loop + async HTTP client for fire-and-forget API calls."""
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="streamlit-http-loop", daemon=True).start()
+    client = httpx.AsyncClient(
+        base_url=API_URL,
+        headers={"Content-Type": "application/json"},
+        timeout=httpx.Timeout(10.0, connect=2.0),
+    )
+    return loop, client
+
+
+def _submit_post(url: str, body: bytes) -> concurrent.futures.Future:
+    """Schedule a POST on the background loop without waiting for it."""
+    loop, client = _async_http()
+    return asyncio.run_coroutine_threadsafe(client.post(url, content=body), loop)
+
+
+def _log_indexing_result(fut: concurrent.futures.Future) -> None:
+    """Log indexing requests that failed after the UI stopped waiting for them."""
+    if fut.cancelled():
+        return
+    exc = fut.exception()
+    if exc is not None:
+        logger.error(f"Indexing request failed: {exc}")
+        return
+    resp = fut.result()
+    if resp.status_code not in (200, 202):
+        logger.error(f"Indexing API returned {resp.status_code}: {resp.text}")
+
+
+def _show_indexing_result(fut: concurrent.futures.Future) -> None:
+    """Render the outcome of a finished indexing request."""
+    try:
+        resp = fut.result(timeout=0)
+    except Exception as e:
+        st.error(f"Failed to call indexing API: {e}")
+        return
+    if resp.status_code in (200, 202):
+        # 상태가 PENDING으로 바뀌었으므로 캐시된 목록을 무효화
+        get_all_statuses_sync.clear()
+        _reset_selection()
+        st.success("Indexing started for selected files.")
+    else:
+        st.error(f"Indexing API returned {resp.status_code}: {resp.text}")
+
+
+# 위젯 조작마다 스크립트가 재실행되므로 짧은 TTL로 조회 결과를 재사용
+@st.cache_data(ttl=5, show_spinner=False)
+def get_all_statuses_sync() -> pd.DataFrame:
+    resp = _http().get(f"{API_URL}/api/monitor/files/statuses", timeout=2)
+    resp.raise_for_status()
+    df = pd.DataFrame(orjson.loads(resp.content), columns=["id", "name", "path", "status"])
+    # 필터용 대문자 상태 컬럼을 캐시 시점에 한 번만 계산
+    df["_status_u"] = df["status"].fillna("").str.upper()
+    return df
+
+
+def _load_statuses() -> pd.DataFrame:
+    """Fetch statuses, showing an error and an empty table if the API is unavailable."""
     try:
-        # Preferred path if no running loop
-        return asyncio.run(coro)
-    except RuntimeError:
-        # If an event loop is already running (e.g., inside Streamlit), run in separate thread
-        result_container = {}
-
-        def _runner():
-            loop = asyncio.new_event_loop()
-            try:
-                asyncio.set_event_loop(loop)
-                result = loop.run_until_complete(coro)
-                result_container["result"] = result
-            finally:
-                loop.close()
-
-        t = threading.Thread(target=_runner)
-        t.start()
-        t.join()
-        return result_container.get("result")
-
-
-async def _fetch_all_statuses() -> List[Dict[str, Any]]:
-    async with AsyncSessionLocal() as session:
-        rows = await list_all_file_statuses(session)
-        # convert ORM objects (if any) to dicts
-        out = []
-        for r in rows:
-            try:
-                out.append({
-                    "id": getattr(r, "id", None),
-                    "name": getattr(r, "name", None),
-                    "path": getattr(r, "path", None),
-                    "status": getattr(r, "status", None),
-                })
-            except Exception:
-                out.append(dict(r))
-        return out
-
-
-def get_all_statuses_sync():
-    return _run_coro_in_thread(_fetch_all_statuses())
+        return get_all_statuses_sync()
+    except (requests.RequestException, orjson.JSONDecodeError) as e:
+        # 실패 결과는 캐시하지 않도록 캐시 함수 밖에서 처리
+        st.error(f"Failed to fetch file statuses from {API_URL}: {e}")
+        return pd.DataFrame(columns=["id", "name", "path", "status", "_status_u"])
+
+
+# 상태 필터 선택지 (임포트 시 한 번만 생성)
+_STATUS_OPTIONS = ("ALL", *[status.value for status in FileStatusEnum])
+
+# data_editor 위젯 키 (선택 상태는 행 번호 기준으로 저장됨)
+_EDITOR_KEY = "file_status_table"
+# 직전 실행에서 표에 표시한 id 순서를 저장하는 세션 키
+_EDITOR_IDS_KEY = "_file_status_table_ids"
+# 응답을 기다리지 않고 넘긴 인덱싱 요청 (다음 실행에서 결과 표시)
+_PENDING_INDEXING_KEY = "_pending_indexing_requests"
+
+
+def _reset_selection():
+    """목록이 바뀌면 행 번호 기반 선택 상태가 다른 파일을 가리키므로 초기화."""
+    st.session_state.pop(_EDITOR_KEY, None)
 
 
 st.set_page_config(page_title="ObsidiRAG - File Statuses", layout="wide")
@@ -81,51 +139,71 @@ with st.sidebar:
             st.session_state["_refresh_toggle"] = not st.session_state.get("_refresh_toggle", False)
 
     if st.button("Refresh"):
+        get_all_statuses_sync.clear()
+        _reset_selection()
         _safe_rerun()
 
-status_options = ["ALL"] + [status.value for status in FileStatusEnum]
-status_filter = st.sidebar.selectbox("Filter by status", options=status_options, index=0)
+status_filter = st.sidebar.selectbox("Filter by status", options=_STATUS_OPTIONS, index=0, on_change=_reset_selection)
+
+# 이전 실행에서 응답 대기 시간을 넘긴 인덱싱 요청 중 끝난 것의 결과를 표시
+pending_requests = st.session_state.get(_PENDING_INDEXING_KEY, [])
+if pending_requests:
+    for fut in pending_requests:
+        if fut.done():
+            _show_indexing_result(fut)
+    st.session_state[_PENDING_INDEXING_KEY] = [fut for fut in pending_requests if not fut.done()]
 
 st.info("Fetching records...")
-rows = get_all_statuses_sync() or []
+df = _load_statuses()
 
 if status_filter != "ALL":
-    rows = [r for r in rows if (r.get("status") or "").upper() == status_filter]
+    df = df[df["_status_u"] == status_filter]
 
 selected_ids = []
-if not rows:
+if df.empty:
     st.write("No file statuses found.")
 else:
     st.write("Select rows to index:")
-    cols = st.columns([0.05, 0.2, 0.55, 0.2])
-    cols[0].write("")
-    cols[1].write("**Name**")
-    cols[2].write("**Path**")
-    cols[3].write("**Status**")
-    for r in rows:
-        cb_col, name_col, path_col, status_col = st.columns([0.05, 0.2, 0.55, 0.2])
-        key = f"select_{r.get('id') or r.get('path')}"
-        checked = cb_col.checkbox("", key=key)
-        name_col.write(r.get("name"))
-        path_col.write(r.get("path"))
-        status_col.write(r.get("status"))
-        if checked:
-            selected_ids.append(r.get("path"))
+    df = df.reset_index(drop=True)
+    # TTL 재조회 등으로 행 구성이 바뀌면 이전 선택이 다른 파일을 가리키므로 초기화
+    row_ids = tuple(df["id"])
+    if st.session_state.get(_EDITOR_IDS_KEY) != row_ids:
+        _reset_selection()
+        st.session_state[_EDITOR_IDS_KEY] = row_ids
+    df.insert(0, "select", False)
+    edited = st.data_editor(
+        df,
+        hide_index=True,
+        width="stretch",
+        column_config={
+            "select": st.column_config.CheckboxColumn("", default=False),
+            "id": None,
+            "_status_u": None,
+            "name": "Name",
+            "path": "Path",
+            "status": "Status",
+        },
+        disabled=["name", "path", "status"],
+        key=_EDITOR_KEY,
+    )
+    selected_ids = edited.loc[edited["select"], "path"].tolist()
 
     st.markdown("---")
-    api_url = os.getenv("API_URL", "http://127.0.0.1:8000")
     if st.button("Start Indexing"):
         if not selected_ids:
             st.warning("No files selected for indexing.")
         else:
-            try:
-                resp = requests.post(f"{api_url}/api/indexing/run", json={"paths": selected_ids}, timeout=10)
-                if resp.status_code == 200:
-                    st.success("Indexing started for selected files.")
-                else:
-                    st.error(f"Indexing API returned {resp.status_code}: {resp.text}")
-            except Exception as e:
-                st.error(f"Failed to call indexing API: {e}")
+            fut = _submit_post("/api/indexing/run", orjson.dumps({"paths": selected_ids}))
+            fut.add_done_callback(_log_indexing_result)
+            # 짧은 시간만 응답(202)을 기다리고, 넘으면 백그라운드에서 계속 진행
+            concurrent.futures.wait([fut], timeout=INDEXING_ACK_TIMEOUT)
+            if fut.done():
+                _show_indexing_result(fut)
+            else:
+                st.session_state.setdefault(_PENDING_INDEXING_KEY, []).append(fut)
+                get_all_statuses_sync.clear()
+                _reset_selection()
+                st.info("Indexing request sent; the result will be shown on the next refresh.")
 
 st.markdown("---")
 st.markdown("Run with: `streamlit run ui/streamlit_app.py`")
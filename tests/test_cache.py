@@ -0,0 +1,45 @@
+import numpy as np
+
+from src.core.indexing.cache import SQLiteEmbeddingCache, make_cache_key
+
+
+def test_make_cache_key_depends_on_model_and_text():
+    key = make_cache_key("model-a", "hello")
+    assert key == make_cache_key("model-a", "hello")
+    assert key != make_cache_key("model-b", "hello")
+    assert key != make_cache_key("model-a", "hello!")
+
+
+def test_set_many_then_get_many_returns_only_cached_keys(tmp_path):
+    cache = SQLiteEmbeddingCache(str(tmp_path / "cache.db"))
+    cache.set_many({"a": [0.5, 1.0, -2.0], "b": [3.0, 4.0, 5.0]})
+
+    found = cache.get_many(["a", "missing", "b"])
+
+    assert set(found) == {"a", "b"}
+    assert found["a"].dtype == np.float32
+    np.testing.assert_array_equal(found["a"], np.array([0.5, 1.0, -2.0], dtype=np.float32))
+    np.testing.assert_array_equal(found["b"], np.array([3.0, 4.0, 5.0], dtype=np.float32))
+
+
+def test_get_many_handles_more_keys_than_one_lookup_chunk(tmp_path):
+    cache = SQLiteEmbeddingCache(str(tmp_path / "cache.db"))
+    items = {f"k{i}": [float(i)] for i in range(1200)}
+    cache.set_many(items)
+
+    found = cache.get_many(list(items) + ["missing"])
+
+    assert len(found) == 1200
+    assert found["k1199"][0] == 1199.0
+
+
+def test_set_many_overwrites_and_persists(tmp_path):
+    db_path = str(tmp_path / "cache.db")
+    cache = SQLiteEmbeddingCache(db_path)
+    cache.set_many({"a": [1.0]})
+    cache.set_many({"a": [2.0]})
+
+    reopened = SQLiteEmbeddingCache(db_path)
+
+    assert reopened.get("a")[0] == 2.0
+    assert reopened.get("missing") is None
@@ -0,0 +1,81 @@
+import asyncio
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.databases.base import Base
+from src.databases.file.crud import bulk_update_file_statuses, list_all_file_status_rows
+from src.databases.file.models.file_status import FileStatus
+from src.databases.file.models.file_status_enum import FileStatusEnum
+
+
+def _run_with_session(tmp_path, body):
+    async def run():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+        statements = []
+
+        @event.listens_for(engine.sync_engine, "before_cursor_execute")
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+        async with session_factory() as session:
+            session.add_all([
+                FileStatus(id=file_id, name=f"{file_id}.md", path=f"/notes/{file_id}.md", status=FileStatusEnum.PENDING)
+                for file_id in ("a", "b", "c", "d")
+            ])
+            await session.commit()
+            statements.clear()
+            result = await body(session, statements)
+        await engine.dispose()
+        return result
+
+    return asyncio.run(run())
+
+
+def _statuses(rows):
+    return {row["id"]: row["status"] for row in rows}
+
+
+def test_bulk_update_issues_one_update_per_status(tmp_path):
+    async def body(session, statements):
+        await bulk_update_file_statuses(session, {
+            "a": FileStatusEnum.SYNCED,
+            "b": FileStatusEnum.ERROR,
+            "c": FileStatusEnum.SYNCED,
+        })
+        updates = [s for s in statements if s.lstrip().upper().startswith("UPDATE")]
+        return updates, await list_all_file_status_rows(session)
+
+    updates, rows = _run_with_session(tmp_path, body)
+
+    assert len(updates) == 2
+    assert _statuses(rows) == {
+        "a": FileStatusEnum.SYNCED,
+        "b": FileStatusEnum.ERROR,
+        "c": FileStatusEnum.SYNCED,
+        "d": FileStatusEnum.PENDING,
+    }
+
+
+def test_bulk_update_without_commit_can_be_rolled_back(tmp_path):
+    async def body(session, statements):
+        await bulk_update_file_statuses(session, {"a": FileStatusEnum.SYNCED}, commit=False)
+        await session.rollback()
+        return await list_all_file_status_rows(session)
+
+    rows = _run_with_session(tmp_path, body)
+
+    assert _statuses(rows)["a"] == FileStatusEnum.PENDING
+
+
+def test_list_all_file_status_rows_is_ordered_by_path(tmp_path):
+    async def body(session, statements):
+        return await list_all_file_status_rows(session)
+
+    rows = _run_with_session(tmp_path, body)
+
+    assert [row["path"] for row in rows] == sorted(row["path"] for row in rows)
+    assert set(rows[0].keys()) == {"id", "name", "path", "status"}
@@ -0,0 +1,48 @@
+import asyncio
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from watchdog.events import FileCreatedEvent, FileModifiedEvent, FileMovedEvent
+
+from src.core.monitor import handler as handler_module
+from src.core.monitor.handler import WatchdogHandler
+from src.databases.base import Base
+from src.databases.file.models.file_status import FileStatus
+from src.databases.file.models.file_status_enum import FileStatusEnum
+
+
+def test_burst_of_events_is_applied_in_order_with_one_commit(tmp_path, monkeypatch):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    commits = []
+    event.listen(engine.sync_engine, "commit", lambda conn: commits.append(conn))
+    session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+
+    async def create_tables():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        await engine.dispose()
+
+    asyncio.run(create_tables())
+    commits.clear()
+    monkeypatch.setattr(handler_module, "AsyncSessionLocal", session_factory)
+
+    # 실행 중인 루프가 없으므로 handler가 전용 루프 스레드를 띄움
+    handler = WatchdogHandler()
+    handler.on_created(FileCreatedEvent("/notes/a.md"))
+    for _ in range(20):
+        handler.on_modified(FileModifiedEvent("/notes/a.md"))
+    handler.on_moved(FileMovedEvent("/notes/a.md", "/notes/b.md"))
+    handler.close()
+
+    async def load_rows():
+        async with session_factory() as session:
+            rows = (await session.execute(select(FileStatus))).scalars().all()
+        await engine.dispose()
+        return rows
+
+    rows = asyncio.run(load_rows())
+
+    assert handler._worker_future.done()
+    # 생성 -> 수정 -> 이동 순서대로 반영되어야 이동된 경로에 MODIFIED 상태가 남음
+    assert [(row.path, row.name, row.status) for row in rows] == [("/notes/b.md", "b.md", FileStatusEnum.MODIFIED)]
+    assert len(commits) == 1
@@ -0,0 +1,193 @@
+import asyncio
+import types
+
+import httpx
+import numpy as np
+import openai
+import pyarrow as pa
+import pytest
+
+from src.core.indexing import index
+from src.core.indexing.cache import SQLiteEmbeddingCache
+
+
+class StubEmbeddings:
+    """OpenAI embeddings.create 대체: 호출별 입력을 기록하고, 'BAD'는 400 오류, 'DOWN'은 그 외 오류로 실패"""
+
+    def __init__(self):
+        self.calls = []
+
+    async def create(self, model, input):
+        self.calls.append(list(input))
+        if any("BAD" in text for text in input):
+            response = httpx.Response(400, request=httpx.Request("POST", "https://api.openai.com/v1/embeddings"))
+            raise openai.BadRequestError("rejected input", response=response, body=None)
+        if any("DOWN" in text for text in input):
+            raise RuntimeError("service unavailable")
+        data = [
+            types.SimpleNamespace(embedding=np.full(index.EMBEDDING_DIMENSION, len(text), dtype=np.float32).tolist())
+            for text in input
+        ]
+        return types.SimpleNamespace(data=data)
+
+
+@pytest.fixture
+def stub_index(tmp_path, monkeypatch):
+    # 네트워크 없이 문자 기반 청킹을 사용하고 API/캐시는 테스트용으로 교체
+    monkeypatch.setattr(index, "tiktoken", None)
+    index._get_encoding.cache_clear()
+    embeddings = StubEmbeddings()
+    monkeypatch.setattr(index, "client", types.SimpleNamespace(embeddings=embeddings))
+    cache = SQLiteEmbeddingCache(str(tmp_path / "embed_cache.db"))
+    monkeypatch.setattr(index, "get_embedding_cache", lambda: cache)
+    monkeypatch.setattr(index, "EMBEDDING_REQUEST_JITTER", 0)
+    yield embeddings
+    index._get_encoding.cache_clear()
+
+
+def _write_notes(tmp_path, contents):
+    paths = []
+    for i, text in enumerate(contents):
+        path = tmp_path / f"note{i}.md"
+        path.write_text(text)
+        paths.append(str(path))
+    return paths
+
+
+def test_index_files_batches_chunks_across_files(tmp_path, monkeypatch, stub_index):
+    monkeypatch.setattr(index, "EMBEDDING_BATCH_MAX_INPUTS", 2)
+    paths = _write_notes(tmp_path, ["first note", "second note", "third note"])
+    db_path = str(tmp_path / "lancedb")
+
+    result = asyncio.run(index.index_files(paths, ["a", "b", "c"], db_path=db_path))
+
+    assert result == {"total": 3, "success": 3, "failed": 0, "failed_files": []}
+    assert sorted(len(call) for call in stub_index.calls) == [1, 2]
+    assert index._get_table(db_path).count_rows() == 3
+
+
+def test_index_files_reuses_cached_embeddings(tmp_path, stub_index):
+    paths = _write_notes(tmp_path, ["same text", "same text"])
+    db_path = str(tmp_path / "lancedb")
+
+    asyncio.run(index.index_files(paths, ["a", "b"], db_path=db_path))
+    asyncio.run(index.index_files(paths[:1], ["c"], db_path=db_path))
+
+    # 같은 텍스트는 한 번만 요청하고, 두 번째 실행은 캐시에서 가져옴
+    assert stub_index.calls == [["same text"]]
+
+
+def test_index_files_retries_failed_batch_per_item(tmp_path, stub_index):
+    paths = _write_notes(tmp_path, ["good one", "BAD input", "good two"])
+    db_path = str(tmp_path / "lancedb")
+
+    result = asyncio.run(index.index_files(paths, ["a", "b", "c"], db_path=db_path))
+
+    assert result["success"] == 2
+    assert result["failed_files"] == [paths[1]]
+    # 배치 요청 1회 실패 후 항목별 3회 재시도
+    assert len(stub_index.calls) == 4
+    assert [len(call) for call in stub_index.calls[1:]] == [1, 1, 1]
+    table = index._get_table(db_path)
+    assert sorted(table.to_arrow().column("file_id").to_pylist()) == ["a", "c"]
+
+
+def test_index_files_fails_whole_batch_on_non_input_error(tmp_path, stub_index):
+    paths = _write_notes(tmp_path, ["good one", "DOWN input", "good two"])
+
+    result = asyncio.run(index.index_files(paths, ["a", "b", "c"], db_path=str(tmp_path / "lancedb")))
+
+    # 입력 오류가 아니면 항목별 재시도 없이 배치 전체가 실패
+    assert result["success"] == 0
+    assert result["failed_files"] == paths
+    assert len(stub_index.calls) == 1
+
+
+def test_sql_string_literal_escapes_single_quotes():
+    assert index._sql_string_literal("plain") == "'plain'"
+    assert index._sql_string_literal("it's") == "'it''s'"
+
+
+def test_delete_file_from_index_handles_quotes_in_file_id(tmp_path, stub_index):
+    paths = _write_notes(tmp_path, ["first note", "second note"])
+    db_path = str(tmp_path / "lancedb")
+    asyncio.run(index.index_files(paths, ["it's", "other"], db_path=db_path))
+
+    assert index.delete_file_from_index("it's", db_path=db_path) is True
+
+    table = index._get_table(db_path)
+    assert table.to_arrow().column("file_id").to_pylist() == ["other"]
+
+
+def test_index_files_reports_unreadable_files(tmp_path, monkeypatch, stub_index):
+    monkeypatch.setattr(index, "MAX_FILE_BYTES", 16)
+    paths = _write_notes(tmp_path, ["readable", "x" * 17])
+    unsupported = tmp_path / "image.bin"
+    unsupported.write_bytes(b"\x00")
+    paths += [str(unsupported), str(tmp_path / "missing.md")]
+
+    result = asyncio.run(index.index_files(paths, ["a", "b", "c", "d"], db_path=str(tmp_path / "lancedb")))
+
+    # 확장자, 크기, 존재 여부로 걸러진 파일은 임베딩 요청 없이 실패 처리
+    assert result["success"] == 1
+    assert result["failed_files"] == paths[1:]
+    assert stub_index.calls == [["readable"]]
+
+
+def _fake_query_embedding(vector):
+    async def create_embeddings(texts, token_counts=None):
+        return [vector.tolist()]
+    return create_embeddings
+
+
+class FakeSearch:
+    """table.search(...) 체인 대체: 지정한 Arrow 테이블을 그대로 반환"""
+
+    def __init__(self, result):
+        self.result = result
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self
+
+    def to_arrow(self):
+        return self.result
+
+
+def test_search_similar_maps_arrow_columns_and_defaults_missing_distance(tmp_path, monkeypatch):
+    result = pa.table({
+        "vector": pa.array([[0.0, 1.0]], type=pa.list_(pa.float16(), 2)),
+        "text": ["hello"],
+        "file_id": ["a"],
+        "file_path": ["/notes/a.md"],
+        "chunk_index": pa.array([3], type=pa.int32()),
+    })
+    table = types.SimpleNamespace(schema=result.schema, search=lambda vector: FakeSearch(result))
+    monkeypatch.setattr(index, "_get_table", lambda db_path: table)
+    monkeypatch.setattr(index, "create_embeddings", _fake_query_embedding(np.array([0.0, 1.0])))
+
+    results = asyncio.run(index.search_similar("hello", db_path=str(tmp_path / "lancedb")))
+
+    # _distance 컬럼이 없으면 점수는 0.0
+    assert results == [{"text": "hello", "file_path": "/notes/a.md", "file_id": "a", "chunk_index": 3, "score": 0.0}]
+
+
+def _one_hot(i):
+    vector = np.zeros(index.EMBEDDING_DIMENSION, dtype=np.float32)
+    vector[i] = 1.0
+    return vector
+
+
+def test_search_similar_on_float16_table(tmp_path, monkeypatch):
+    db_path = str(tmp_path / "lancedb")
+    table = index._get_table(db_path, create=True)
+    table.add(pa.Table.from_batches([
+        index._build_record_batch([_one_hot(0), _one_hot(1)], ["zero", "one"], "a", "/notes/a.md", [0, 1]),
+    ]))
+    monkeypatch.setattr(index, "create_embeddings", _fake_query_embedding(_one_hot(1)))
+
+    results = asyncio.run(index.search_similar("query", limit=2, db_path=db_path))
+
+    # 벡터는 float16으로 저장되고 float32 쿼리 벡터도 같은 타입으로 맞춰 검색됨
+    assert table.schema.field("vector").type.value_type == pa.float16()
+    assert [r["text"] for r in results] == ["one", "zero"]
+    assert results[0]["score"] == pytest.approx(0.0, abs=1e-3)
@@ -0,0 +1,61 @@
+import asyncio
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.core.indexing import api
+from src.databases.base import Base
+from src.databases.database import get_db
+from src.databases.file.models.file_status import FileStatus
+from src.databases.file.models.file_status_enum import FileStatusEnum
+
+
+def test_run_indexing_returns_202_and_updates_statuses_in_background(tmp_path, monkeypatch):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+
+    async def seed():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with session_factory() as session:
+            session.add_all([
+                FileStatus(id=file_id, name=f"{file_id}.md", path=f"/notes/{file_id}.md", status=FileStatusEnum.MODIFIED)
+                for file_id in ("a", "b")
+            ])
+            await session.commit()
+        await engine.dispose()
+
+    asyncio.run(seed())
+
+    indexed = []
+
+    async def fake_index_files(paths, file_ids):
+        indexed.append((paths, file_ids))
+        return {"total": 2, "success": 1, "failed": 1, "failed_files": ["/notes/b.md"]}
+
+    async def override_get_db():
+        async with session_factory() as session:
+            yield session
+
+    monkeypatch.setattr(api, "index_files", fake_index_files)
+    monkeypatch.setattr(api, "AsyncSessionLocal", session_factory)
+    app = FastAPI()
+    app.include_router(api.router)
+    app.dependency_overrides[get_db] = override_get_db
+
+    # TestClient는 응답을 돌려주기 전에 백그라운드 작업까지 실행함
+    with TestClient(app) as client:
+        response = client.post("/api/indexing/run", json={"paths": ["/notes/a.md", "/notes/b.md", "/notes/missing.md"]})
+
+    async def load_statuses():
+        async with session_factory() as session:
+            rows = (await session.execute(select(FileStatus))).scalars().all()
+        await engine.dispose()
+        return {row.id: row.status for row in rows}
+
+    assert response.status_code == 202
+    assert response.json() == {"status": "queued", "count": 2}
+    assert indexed == [(["/notes/a.md", "/notes/b.md"], ["a", "b"])]
+    assert asyncio.run(load_statuses()) == {"a": FileStatusEnum.SYNCED, "b": FileStatusEnum.ERROR}
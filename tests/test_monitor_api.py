@@ -0,0 +1,50 @@
+import asyncio
+
+import orjson
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.core.monitor.api import router
+from src.databases.base import Base
+from src.databases.database import get_db
+from src.databases.file.models.file_status import FileStatus
+from src.databases.file.models.file_status_enum import FileStatusEnum
+
+
+def test_get_all_file_statuses_returns_orjson_rows(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+
+    async def seed():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with session_factory() as session:
+            session.add_all([
+                FileStatus(id="a", name="a.md", path="/notes/a.md", status=FileStatusEnum.SYNCED),
+                FileStatus(id="b", name="b.md", path="/notes/b.md", status=FileStatusEnum.ERROR),
+            ])
+            await session.commit()
+        await engine.dispose()
+
+    asyncio.run(seed())
+
+    async def override_get_db():
+        async with session_factory() as session:
+            yield session
+
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_db] = override_get_db
+
+    with TestClient(app) as client:
+        response = client.get("/api/monitor/files/statuses")
+    asyncio.run(engine.dispose())
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    # Enum은 값 문자열로 직렬화되어 응답 모델과 같은 형태가 됨
+    assert sorted(orjson.loads(response.content), key=lambda row: row["id"]) == [
+        {"id": "a", "name": "a.md", "path": "/notes/a.md", "status": "SYNCED"},
+        {"id": "b", "name": "b.md", "path": "/notes/b.md", "status": "ERROR"},
+    ]
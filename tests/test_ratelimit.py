@@ -0,0 +1,46 @@
+import asyncio
+import time
+
+from src.core.indexing.ratelimit import AsyncTokenBucket
+
+
+def test_acquire_within_burst_does_not_wait():
+    bucket = AsyncTokenBucket(rate_per_min=60, burst=3)
+
+    async def run():
+        start = time.monotonic()
+        for _ in range(3):
+            await bucket.acquire()
+        return time.monotonic() - start
+
+    assert asyncio.run(run()) < 0.05
+
+
+def test_acquire_waits_for_refill_when_empty():
+    # 초당 20개 충전, 버킷 용량 2
+    bucket = AsyncTokenBucket(rate_per_min=1200, burst=2)
+
+    async def run():
+        await bucket.acquire(2)
+        start = time.monotonic()
+        await bucket.acquire(1)
+        return time.monotonic() - start
+
+    waited = asyncio.run(run())
+    assert 0.03 <= waited < 0.5
+
+
+def test_acquire_more_than_capacity_is_capped():
+    bucket = AsyncTokenBucket(rate_per_min=60, burst=5)
+
+    async def run():
+        await asyncio.wait_for(bucket.acquire(1000), timeout=1)
+
+    asyncio.run(run())
+    assert bucket._tokens < 1
+
+
+def test_default_burst_is_rate_per_minute():
+    bucket = AsyncTokenBucket(rate_per_min=120)
+    assert bucket.capacity == 120
+    assert bucket.rate == 2